@@ -9,11 +9,21 @@ generation required for IT Engineer (Identity/IAM) role - specifically
 "preparing evidence for SOC 2, ISO27001, and other regulatory audits."
 """
 
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import json
+import secrets
+import time
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json still works
+    orjson = None
 
 
 # =============================================================================
@@ -49,6 +59,10 @@ class ControlMapping(BaseModel):
     satisfied: bool
     evidence_reference: Optional[str] = None
 
+    # The module-level control templates below are shared; freezing
+    # them forces campaign-specific state through model_copy(update=...)
+    model_config = ConfigDict(frozen=True)
+
 
 class CampaignEvidence(BaseModel):
     """Audit evidence for a certification campaign"""
@@ -127,7 +141,7 @@ class ExecutiveSummary(BaseModel):
 # =============================================================================
 
 # SOC 2 Control Mappings
-SOC2_CONTROLS = {
+SOC2_CONTROLS = MappingProxyType({
     "CC6.1": ControlMapping(
         framework=ComplianceFramework.SOC2,
         control_id="CC6.1",
@@ -155,10 +169,10 @@ SOC2_CONTROLS = {
         evidence_type="Revocation decisions and completion evidence",
         satisfied=False
     ),
-}
+})
 
 # ISO 27001 Control Mappings
-ISO27001_CONTROLS = {
+ISO27001_CONTROLS = MappingProxyType({
     "A.9.2.1": ControlMapping(
         framework=ComplianceFramework.ISO27001,
         control_id="A.9.2.1",
@@ -176,10 +190,10 @@ ISO27001_CONTROLS = {
         evidence_type="Quarterly access certification campaign report",
         satisfied=False
     ),
-}
+})
 
 # NIST Control Mappings
-NIST_CONTROLS = {
+NIST_CONTROLS = MappingProxyType({
     "AC-2": ControlMapping(
         framework=ComplianceFramework.NIST,
         control_id="AC-2",
@@ -189,7 +203,31 @@ NIST_CONTROLS = {
         evidence_type="Access certification with remediation actions",
         satisfied=False
     ),
-}
+})
+
+
+# Framework -> control-table lookup shared by every generator instance
+_FRAMEWORK_CONTROLS = MappingProxyType({
+    ComplianceFramework.SOC2: SOC2_CONTROLS,
+    ComplianceFramework.ISO27001: ISO27001_CONTROLS,
+    ComplianceFramework.NIST: NIST_CONTROLS,
+})
+
+
+# Numeric campaign fields the executive summary aggregates, transposed
+# into struct-of-arrays columns before reduction
+_SUMMARY_COLUMNS = (
+    "total_items",
+    "certified_items",
+    "revoked_items",
+    "critical_items",
+    "critical_remediated",
+    "sod_conflicts_found",
+    "sod_conflicts_resolved",
+)
+
+# Audit-event columns rendered in the markdown audit trail, in order
+_AUDIT_EVENT_FIELDS = ("timestamp", "event", "user", "details")
 
 
 # =============================================================================
@@ -200,19 +238,47 @@ class ComplianceReportGenerator:
     """Generates compliance reports for access certification campaigns"""
 
     def __init__(self):
-        self.control_mappings = {
-            ComplianceFramework.SOC2: SOC2_CONTROLS,
-            ComplianceFramework.ISO27001: ISO27001_CONTROLS,
-            ComplianceFramework.NIST: NIST_CONTROLS,
-        }
+        self.control_mappings = dict(_FRAMEWORK_CONTROLS)
+        # Flattened control tuples cached per framework set; instance-
+        # level so generators with customized control_mappings stay
+        # correct
+        self._flat_cache: Dict[frozenset, tuple] = {}
+
+    def _flat_controls(self, frameworks: List[ComplianceFramework]) -> tuple:
+        """Return the flattened control templates for a framework set.
+
+        Audits call evidence generation once per campaign with the same
+        few framework combinations, so the flattened tuple is built once
+        per combination instead of re-walking the nested dicts per
+        campaign.
+        """
+        key = frozenset(frameworks)
+        flat = self._flat_cache.get(key)
+        if flat is None:
+            flat = tuple(
+                control
+                for framework in frameworks
+                for control in self.control_mappings.get(framework, {}).values()
+            )
+            self._flat_cache[key] = flat
+        return flat
 
     def generate_campaign_evidence(
         self,
         campaign_data: Dict[str, Any],
         generated_by: str,
-        frameworks: List[ComplianceFramework] = None
+        frameworks: List[ComplianceFramework] = None,
+        precomputed_completion_rate: Optional[float] = None,
+        include_control_mappings: bool = True
     ) -> CampaignEvidence:
-        """Generate audit evidence for a certification campaign"""
+        """Generate audit evidence for a certification campaign.
+
+        Batch callers that already computed the completion rate (see
+        generate_audit_package) can pass it in to skip re-deriving it
+        here. Callers that only need the aggregate statistics can pass
+        include_control_mappings=False to skip materializing a per-
+        control copy for every framework.
+        """
 
         frameworks = frameworks or [
             ComplianceFramework.SOC2,
@@ -228,17 +294,24 @@ class ComplianceReportGenerator:
         total = campaign_data.get("total_items", 0)
         certified = campaign_data.get("certified_items", 0)
         revoked = campaign_data.get("revoked_items", 0)
-        completion_rate = ((certified + revoked) / total * 100) if total > 0 else 0
+        if precomputed_completion_rate is not None:
+            completion_rate = precomputed_completion_rate
+        else:
+            completion_rate = ((certified + revoked) / total * 100) if total > 0 else 0
 
-        # Get control mappings
+        # Get control mappings; the shared templates are immutable, so
+        # campaign-specific fields are applied via model_copy(update=...)
         mappings = []
-        for framework in frameworks:
-            framework_controls = self.control_mappings.get(framework, {})
-            for control in framework_controls.values():
-                control_copy = control.copy()
-                control_copy.satisfied = completion_rate >= 95  # 95% threshold
-                control_copy.evidence_reference = f"Campaign-{campaign_data.get('id')}"
-                mappings.append(control_copy)
+        if include_control_mappings:
+            satisfied = completion_rate >= 95  # 95% threshold
+            evidence_reference = f"Campaign-{campaign_data.get('id')}"
+            mappings = [
+                control.model_copy(update={
+                    "satisfied": satisfied,
+                    "evidence_reference": evidence_reference,
+                })
+                for control in self._flat_controls(frameworks)
+            ]
 
         return CampaignEvidence(
             campaign_id=campaign_data.get("id", "unknown"),
@@ -271,51 +344,51 @@ class ComplianceReportGenerator:
     ) -> ExecutiveSummary:
         """Generate executive summary across multiple campaigns"""
 
-        # Aggregate metrics
+        # Transpose the campaign dicts into contiguous numeric columns
+        # (SoA), then reduce each column in C via sum()/count() instead
+        # of interpreting dict lookups per metric per campaign
         total_campaigns = len(campaigns)
-        completed = sum(1 for c in campaigns if c.get("status") == "completed")
-        active = sum(1 for c in campaigns if c.get("status") == "active")
-
-        total_items = sum(c.get("total_items", 0) for c in campaigns)
-        certified = sum(c.get("certified_items", 0) for c in campaigns)
-        revoked = sum(c.get("revoked_items", 0) for c in campaigns)
-
-        # Unique users
-        users = set()
+        cols = {
+            key: array("q", (c.get(key, 0) for c in campaigns))
+            for key in _SUMMARY_COLUMNS
+        }
+        total_items = sum(cols["total_items"])
+        certified = sum(cols["certified_items"])
+        revoked = sum(cols["revoked_items"])
+        critical_identified = sum(cols["critical_items"])
+        critical_remediated = sum(cols["critical_remediated"])
+        sod_total = sum(cols["sod_conflicts_found"])
+        sod_resolved = sum(cols["sod_conflicts_resolved"])
+
+        statuses = [c.get("status") for c in campaigns]
+        completed = statuses.count("completed")
+        active = statuses.count("active")
+
+        controls_satisfied = controls_total = 0
         for c in campaigns:
-            users.update(c.get("user_ids", []))
+            mappings = c.get("control_mappings", [])
+            controls_total += len(mappings)
+            controls_satisfied += sum(1 for m in mappings if m.get("satisfied"))
 
-        # Risk metrics
-        critical_identified = sum(c.get("critical_items", 0) for c in campaigns)
-        critical_remediated = sum(c.get("critical_remediated", 0) for c in campaigns)
-        sod_total = sum(c.get("sod_conflicts_found", 0) for c in campaigns)
-        sod_resolved = sum(c.get("sod_conflicts_resolved", 0) for c in campaigns)
-
-        # Compliance score
-        controls_satisfied = 0
-        controls_total = 0
-        for c in campaigns:
-            for mapping in c.get("control_mappings", []):
-                controls_total += 1
-                if mapping.get("satisfied"):
-                    controls_satisfied += 1
+        # Unique users: one bulk union instead of per-campaign update calls
+        users = set().union(*(c.get("user_ids", []) for c in campaigns)) if campaigns else set()
 
         compliance_score = (controls_satisfied / controls_total * 100) if controls_total > 0 else 0
 
-        # Generate recommendations
-        recommendations = []
-        if revoked / total_items > 0.1 if total_items > 0 else False:
-            recommendations.append(
-                "High revocation rate (>10%) indicates need for improved provisioning controls"
-            )
-        if sod_total > 0 and sod_resolved < sod_total:
-            recommendations.append(
-                f"{sod_total - sod_resolved} SoD conflicts require remediation"
-            )
-        if active > completed:
-            recommendations.append(
-                "Multiple active campaigns - consider staggering to reduce reviewer fatigue"
-            )
+        # Generate recommendations. revoked * 10 > total_items is the
+        # guarded integer form of "revocation rate > 10%": it skips the
+        # float division entirely and stays exact at the boundary, and
+        # the total_items > 0 guard keeps empty periods out of the
+        # high-revocation recommendation.
+        candidates = (
+            (total_items > 0 and revoked * 10 > total_items,
+             "High revocation rate (>10%) indicates need for improved provisioning controls"),
+            (sod_total > 0 and sod_resolved < sod_total,
+             f"{sod_total - sod_resolved} SoD conflicts require remediation"),
+            (active > completed,
+             "Multiple active campaigns - consider staggering to reduce reviewer fatigue"),
+        )
+        recommendations = [message for condition, message in candidates if condition]
 
         return ExecutiveSummary(
             report_date=date.today(),
@@ -345,14 +418,18 @@ class ComplianceReportGenerator:
             recommendations=recommendations
         )
 
-    def export_to_markdown(
+    def _iter_markdown_lines(
         self,
         evidence: CampaignEvidence,
-        include_audit_trail: bool = True
-    ) -> str:
-        """Export campaign evidence to markdown format"""
+        include_audit_trail: bool
+    ):
+        """Yield the markdown report chunk by chunk.
 
-        md = f"""# Access Certification Campaign Evidence
+        Shared by the string and streaming exporters so peak memory for
+        the streaming path stays O(row) rather than O(report).
+        """
+
+        yield f"""# Access Certification Campaign Evidence
 
 ## Campaign Details
 
@@ -399,37 +476,90 @@ class ComplianceReportGenerator:
 |-----------|------------|--------------|-----------|
 """
         for mapping in evidence.control_mappings:
-            status = "Yes" if mapping.satisfied else "No"
-            md += f"| {mapping.framework.value} | {mapping.control_id} | {mapping.control_name} | {status} |\n"
+            yield f"| {mapping.framework.value} | {mapping.control_id} | {mapping.control_name} | {'Yes' if mapping.satisfied else 'No'} |\n"
 
         if include_audit_trail and evidence.audit_events:
-            md += "\n## Audit Trail\n\n"
-            md += "| Timestamp | Event | User | Details |\n"
-            md += "|-----------|-------|------|--------|\n"
-            for event in evidence.audit_events[-20:]:  # Last 20 events
-                md += f"| {event.get('timestamp', 'N/A')} | {event.get('event', 'N/A')} | {event.get('user', 'N/A')} | {event.get('details', 'N/A')} |\n"
-
-        md += f"""
+            yield "\n## Audit Trail\n\n"
+            yield "| Timestamp | Event | User | Details |\n"
+            yield "|-----------|-------|------|--------|\n"
+            recent_events = evidence.audit_events[-20:]  # Last 20 events
+            for event in recent_events:
+                get = event.get  # bind once; four lookups per row otherwise
+                yield "| " + " | ".join(
+                    str(get(field, "N/A")) for field in _AUDIT_EVENT_FIELDS
+                ) + " |\n"
+
+        yield """
 ---
 
 *This report was generated for compliance audit purposes.*
 *Chainguard IT Engineer (Identity/IAM) Portfolio - Mike Dominic*
 """
 
-        return md
+    def export_to_markdown(
+        self,
+        evidence: CampaignEvidence,
+        include_audit_trail: bool = True
+    ) -> str:
+        """Export campaign evidence to markdown format"""
+        return "".join(self._iter_markdown_lines(evidence, include_audit_trail))
+
+    def export_to_markdown_stream(
+        self,
+        evidence: CampaignEvidence,
+        sink,
+        include_audit_trail: bool = True
+    ) -> None:
+        """Write the markdown report incrementally to a file-like sink.
+
+        Suitable for piping large audit packages straight into a file,
+        gzip stream, or chunked HTTP response without materializing the
+        whole report in memory.
+        """
+        sink.writelines(self._iter_markdown_lines(evidence, include_audit_trail))
 
     def export_to_json(self, evidence: CampaignEvidence) -> str:
         """Export campaign evidence to JSON format"""
-        return evidence.json(indent=2)
+        return self.export_to_json_bytes(evidence).decode()
+
+    def export_to_json_bytes(self, evidence: CampaignEvidence) -> bytes:
+        """Export campaign evidence as JSON bytes.
+
+        Uses orjson's C serializer when available (an evidence document
+        carries many nested control mappings and audit events), and
+        returning bytes saves a decode when writing straight to disk or
+        an HTTP response.
+        """
+        if orjson is not None:
+            return orjson.dumps(
+                evidence.model_dump(),
+                default=str,
+                option=orjson.OPT_INDENT_2
+            )
+        return evidence.model_dump_json(indent=2).encode()
 
 
 # =============================================================================
 # AUDIT EVIDENCE PACKAGE
 # =============================================================================
 
+# package_id minting: strftime output is cached per second so bulk
+# package generation doesn't re-run utcnow()+strftime per instance; the
+# short random suffix keeps ids unique within the cached second
+_PKG_TS_CACHE = [0, ""]
+
+
+def _mint_package_id() -> str:
+    now = time.time_ns() // 1_000_000_000
+    if now != _PKG_TS_CACHE[0]:
+        _PKG_TS_CACHE[0] = now
+        _PKG_TS_CACHE[1] = datetime.utcfromtimestamp(now).strftime('%Y%m%d%H%M%S')
+    return f"AEP-{_PKG_TS_CACHE[1]}-{secrets.token_hex(3)}"
+
+
 class AuditEvidencePackage(BaseModel):
     """Complete audit evidence package for external auditors"""
-    package_id: str = Field(default_factory=lambda: f"AEP-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}")
+    package_id: str = Field(default_factory=_mint_package_id)
     generated_at: datetime = Field(default_factory=datetime.utcnow)
     generated_by: str
     audit_period_start: date
@@ -450,31 +580,79 @@ class AuditEvidencePackage(BaseModel):
     controls_satisfied: int = 0
 
 
+# Below this many campaigns, process-pool startup costs more than the
+# evidence generation it parallelizes
+_PARALLEL_EVIDENCE_THRESHOLD = 32
+
+
+def _evidence_worker(args):
+    """Build evidence for one campaign in a worker process.
+
+    Module-level (and building its own generator) so it pickles cleanly
+    for ProcessPoolExecutor.
+    """
+    campaign, generated_by, frameworks, completion_rate, include_mappings = args
+    return ComplianceReportGenerator().generate_campaign_evidence(
+        campaign,
+        generated_by,
+        frameworks,
+        precomputed_completion_rate=completion_rate,
+        include_control_mappings=include_mappings
+    )
+
+
 def generate_audit_package(
     campaigns: List[Dict[str, Any]],
     audit_period_start: date,
     audit_period_end: date,
     generated_by: str,
-    frameworks: List[ComplianceFramework] = None
+    frameworks: List[ComplianceFramework] = None,
+    summary_only: bool = False
 ) -> AuditEvidencePackage:
     """
     Generate a complete audit evidence package
 
     This implements the "preparing evidence for SOC 2, ISO27001" requirement.
+
+    With summary_only=True the per-campaign evidence skips materializing
+    control-mapping copies (the executive summary and the package-level
+    control counts don't need them), which drops the dominant allocation
+    cost for summary dashboards.
     """
 
     generator = ComplianceReportGenerator()
     frameworks = frameworks or [ComplianceFramework.SOC2, ComplianceFramework.ISO27001]
 
-    # Generate evidence for each campaign
-    campaign_evidence = []
+    # Completion rates for all campaigns in one guarded pass up front;
+    # each evidence build then reuses its rate instead of re-deriving it
+    rates = []
     for campaign in campaigns:
-        evidence = generator.generate_campaign_evidence(
-            campaign,
-            generated_by,
-            frameworks
-        )
-        campaign_evidence.append(evidence)
+        total = campaign.get("total_items", 0)
+        decided = campaign.get("certified_items", 0) + campaign.get("revoked_items", 0)
+        rates.append((decided / total * 100) if total > 0 else 0)
+
+    # Generate evidence for each campaign; evidence generation is pure
+    # and CPU-bound, so large audits fan out across cores
+    include_mappings = not summary_only
+    if len(campaigns) >= _PARALLEL_EVIDENCE_THRESHOLD:
+        with ProcessPoolExecutor() as pool:
+            campaign_evidence = list(pool.map(
+                _evidence_worker,
+                ((c, generated_by, frameworks, rate, include_mappings)
+                 for c, rate in zip(campaigns, rates)),
+                chunksize=8
+            ))
+    else:
+        campaign_evidence = [
+            generator.generate_campaign_evidence(
+                campaign,
+                generated_by,
+                frameworks,
+                precomputed_completion_rate=rate,
+                include_control_mappings=include_mappings
+            )
+            for campaign, rate in zip(campaigns, rates)
+        ]
 
     # Generate executive summary
     period = f"{audit_period_start.strftime('%B %d, %Y')} - {audit_period_end.strftime('%B %d, %Y')}"
@@ -5,12 +5,23 @@ Demonstrates SAML 2.0 SSO integration with Okta as Identity Provider.
 Implements SSO, SLO, and attribute mapping.
 """
 
+import functools
+import hashlib
 import os
 import json
-from flask import Flask, request, redirect, session, render_template_string, url_for
+import secrets
+import time
+from flask import Flask, Response, g, request, redirect, session, url_for
 from onelogin.saml2.auth import OneLogin_Saml2_Auth
+from onelogin.saml2.settings import OneLogin_Saml2_Settings
 from onelogin.saml2.utils import OneLogin_Saml2_Utils
 from dotenv import load_dotenv
+from markupsafe import escape
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json still works
+    orjson = None
 
 # Load environment variables
 load_dotenv()
@@ -21,6 +32,61 @@ app.secret_key = os.getenv('SECRET_KEY', 'dev_secret_key_change_in_production')
 # SAML settings path
 SAML_PATH = os.path.join(os.path.dirname(__file__), 'saml')
 
+@functools.lru_cache(maxsize=1)
+def _get_settings():
+    """Parse the SAML settings JSON + certificates from disk once
+
+    Settings are immutable once loaded, so the first SAML request pays
+    the parse and every later request reuses the object. Construction is
+    deferred to first use rather than import time: the strict validation
+    rejects the placeholder saml/settings.json, and building eagerly
+    would stop the app from even starting before Okta is configured.
+    """
+    return OneLogin_Saml2_Settings(
+        custom_base_path=SAML_PATH,
+        sp_validation_only=False
+    )
+
+
+# Server-side store for SAML session data. Attribute sets (group lists
+# etc.) can be large, and everything in flask.session is serialized and
+# HMAC-signed into the cookie on every response; keeping the bulky data
+# here means the cookie only carries an opaque session id plus the
+# NameID/session index needed for SLO. In-process only — swap for Redis
+# when running multiple workers.
+SESSION_TTL_SECONDS = 3600
+_SESSION_STORE_MAX = 10_000
+_SESSION_STORE = {}  # sid -> (expires_at, data)
+
+
+def _session_store_put(data):
+    """Store session data server-side and return its opaque id"""
+    now = time.time()
+    if len(_SESSION_STORE) >= _SESSION_STORE_MAX:
+        for sid in [s for s, (exp, _) in _SESSION_STORE.items() if exp < now]:
+            _SESSION_STORE.pop(sid, None)
+    sid = secrets.token_urlsafe(16)
+    _SESSION_STORE[sid] = (now + SESSION_TTL_SECONDS, data)
+    return sid
+
+
+def _session_store_get(sid):
+    """Return stored session data, or None if missing/expired"""
+    entry = _SESSION_STORE.get(sid)
+    if entry is None:
+        return None
+    expires_at, data = entry
+    if expires_at < time.time():
+        _SESSION_STORE.pop(sid, None)
+        return None
+    return data
+
+
+def _clear_session():
+    """Drop the server-side entry and the cookie session together"""
+    _SESSION_STORE.pop(session.get('sid'), None)
+    session.clear()
+
 
 def init_saml_auth(req):
     """
@@ -30,9 +96,9 @@ def init_saml_auth(req):
         req: Dictionary with request data
 
     Returns:
-        OneLogin_Saml2_Auth instance
+        OneLogin_Saml2_Auth instance (reusing the cached settings)
     """
-    auth = OneLogin_Saml2_Auth(req, custom_base_path=SAML_PATH)
+    auth = OneLogin_Saml2_Auth(req, old_settings=_get_settings())
     return auth
 
 
@@ -44,14 +110,19 @@ def prepare_flask_request(request):
         request: Flask request object
 
     Returns:
-        Dictionary with request data formatted for python3-saml
+        Dictionary with request data formatted for python3-saml,
+        memoized on flask.g so routes calling this more than once per
+        request don't re-copy the form/query data
     """
+    cached = g.get('_saml_req')
+    if cached is not None:
+        return cached
+
     # Extract host and port
-    url_data = request.url.split('://', 1)
-    scheme = url_data[0]
-    host = url_data[1].split('/', 1)[0]
+    scheme, _, rest = request.url.partition('://')
+    host = rest.split('/', 1)[0]
 
-    return {
+    req = {
         'https': 'on' if scheme == 'https' else 'off',
         'http_host': host,
         'script_name': request.path,
@@ -60,22 +131,32 @@ def prepare_flask_request(request):
         'post_data': request.form.copy(),
         'query_string': request.query_string.decode('utf-8')
     }
+    g._saml_req = req
+    return req
 
 
 @app.route('/')
 def index():
     """Landing page - shows login button or user info if authenticated"""
-    if 'samlUserdata' in session:
+    user_data = _session_store_get(session.get('sid'))
+    if user_data is not None:
         # User is authenticated
-        attributes = session['samlUserdata']
+        attributes = user_data['attributes']
         name_id = session.get('samlNameId', 'Unknown')
 
-        return render_template_string(DASHBOARD_TEMPLATE,
-                                     name_id=name_id,
-                                     attributes=attributes)
+        return _DASHBOARD_TMPL.render(name_id=name_id,
+                                      attributes=attributes)
     else:
-        # User not authenticated - show login page
-        return render_template_string(LOGIN_TEMPLATE)
+        if 'sid' in session:
+            # Stale cookie pointing at an expired server-side entry
+            session.clear()
+        # User not authenticated - the login page is constant, so serve
+        # the pre-rendered bytes and honor conditional requests
+        if request.if_none_match.contains(_LOGIN_ETAG):
+            return Response(status=304)
+        resp = Response(_LOGIN_BYTES, mimetype='text/html')
+        resp.set_etag(_LOGIN_ETAG)
+        return resp
 
 
 @app.route('/login')
@@ -105,22 +186,21 @@ def saml_acs():
 
     if errors:
         error_reason = auth.get_last_error_reason()
-        return render_template_string(ERROR_TEMPLATE,
-                                     errors=errors,
-                                     error_reason=error_reason), 400
+        return _render_error(errors, error_reason), 400
 
     # Check if user is authenticated
     if not auth.is_authenticated():
-        return render_template_string(ERROR_TEMPLATE,
-                                     errors=['Not authenticated'],
-                                     error_reason='Authentication failed'), 401
-
-    # Store user data in session
-    session['samlUserdata'] = auth.get_attributes()
+        return _render_error(['Not authenticated'], 'Authentication failed'), 401
+
+    # Keep the bulky user data server-side; the signed cookie carries
+    # only the opaque sid plus the NameID/session index needed for SLO
+    session['sid'] = _session_store_put({
+        'attributes': auth.get_attributes(),
+        'name_id_format': auth.get_nameid_format(),
+        'name_id_nq': auth.get_nameid_nq(),
+        'name_id_spnq': auth.get_nameid_spnq(),
+    })
     session['samlNameId'] = auth.get_nameid()
-    session['samlNameIdFormat'] = auth.get_nameid_format()
-    session['samlNameIdNameQualifier'] = auth.get_nameid_nq()
-    session['samlNameIdSPNameQualifier'] = auth.get_nameid_spnq()
     session['samlSessionIndex'] = auth.get_session_index()
 
     # Redirect to original URL or dashboard
@@ -146,9 +226,7 @@ def saml_metadata():
     errors = settings.validate_metadata(metadata)
 
     if errors:
-        return render_template_string(ERROR_TEMPLATE,
-                                     errors=errors,
-                                     error_reason='Invalid SP metadata'), 500
+        return _render_error(errors, 'Invalid SP metadata'), 500
 
     return metadata, 200, {'Content-Type': 'text/xml'}
 
@@ -165,14 +243,12 @@ def saml_sls():
     auth = init_saml_auth(req)
 
     # Process SLO request/response
-    url = auth.process_slo(delete_session_cb=lambda: session.clear())
+    url = auth.process_slo(delete_session_cb=_clear_session)
     errors = auth.get_errors()
 
     if errors:
         error_reason = auth.get_last_error_reason()
-        return render_template_string(ERROR_TEMPLATE,
-                                     errors=errors,
-                                     error_reason=error_reason), 400
+        return _render_error(errors, error_reason), 400
 
     if url:
         return redirect(url)
@@ -191,14 +267,15 @@ def logout():
     auth = init_saml_auth(req)
 
     # Get session data for SLO
+    user_data = _session_store_get(session.get('sid')) or {}
     name_id = session.get('samlNameId')
     session_index = session.get('samlSessionIndex')
-    name_id_format = session.get('samlNameIdFormat')
-    name_id_nq = session.get('samlNameIdNameQualifier')
-    name_id_spnq = session.get('samlNameIdSPNameQualifier')
+    name_id_format = user_data.get('name_id_format')
+    name_id_nq = user_data.get('name_id_nq')
+    name_id_spnq = user_data.get('name_id_spnq')
 
     # Clear local session
-    session.clear()
+    _clear_session()
 
     # Send SLO request to Okta
     return redirect(auth.logout(
@@ -213,15 +290,27 @@ def logout():
 @app.route('/attributes')
 def attributes():
     """Display raw SAML attributes from session"""
-    if 'samlUserdata' not in session:
+    user_data = _session_store_get(session.get('sid'))
+    if user_data is None:
         return redirect(url_for('index'))
 
-    attributes = session.get('samlUserdata', {})
     name_id = session.get('samlNameId', 'Unknown')
 
-    return render_template_string(ATTRIBUTES_TEMPLATE,
-                                 name_id=name_id,
-                                 attributes=json.dumps(attributes, indent=2))
+    # Serialize once per login, not per page view; the pretty-printed
+    # JSON is cached alongside the attributes in the session store
+    attrs_json = user_data.get('_attrs_json')
+    if attrs_json is None:
+        if orjson is not None:
+            attrs_json = orjson.dumps(
+                user_data['attributes'],
+                option=orjson.OPT_INDENT_2
+            ).decode()
+        else:
+            attrs_json = json.dumps(user_data['attributes'], indent=2)
+        user_data['_attrs_json'] = attrs_json
+
+    return _ATTRIBUTES_TMPL.render(name_id=name_id,
+                                   attributes=attrs_json)
 
 
 # HTML Templates (inline for simplicity)
@@ -587,5 +676,36 @@ ERROR_TEMPLATE = """
 """
 
 
+# Templates are module constants; compile them once at import instead of
+# paying Jinja's lexer and parser inside every request
+_LOGIN_TMPL = app.jinja_env.from_string(LOGIN_TEMPLATE)
+_DASHBOARD_TMPL = app.jinja_env.from_string(DASHBOARD_TEMPLATE)
+
+# The login page takes no template variables; render it once and serve
+# the cached bytes with a strong ETag so repeat visitors get 304s
+_LOGIN_BYTES = _LOGIN_TMPL.render().encode('utf-8')
+_LOGIN_ETAG = hashlib.sha256(_LOGIN_BYTES).hexdigest()
+_ATTRIBUTES_TMPL = app.jinja_env.from_string(ATTRIBUTES_TEMPLATE)
+
+# The error page only interpolates two values, so it is pre-split into
+# static segments at import and rendered by concatenation -- no Jinja
+# lexing or parsing on the error path. Escaping matches Jinja's
+# autoescape behavior.
+_ERR_PRE, _, _err_rest = ERROR_TEMPLATE.partition("{{ error_reason }}")
+_ERR_MID, _, _err_rest = _err_rest.partition("{% if errors %}")
+_err_if_body, _, _ERR_POST = _err_rest.partition("{% endif %}")
+_ERR_IF_PRE, _, _ERR_IF_POST = _err_if_body.partition("{{ errors }}")
+del _err_rest, _err_if_body
+
+
+def _render_error(errors, error_reason):
+    """Render the SAML error page without invoking Jinja"""
+    parts = [_ERR_PRE, str(escape(error_reason)), _ERR_MID]
+    if errors:
+        parts.extend((_ERR_IF_PRE, str(escape(str(errors))), _ERR_IF_POST))
+    parts.append(_ERR_POST)
+    return "".join(parts)
+
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
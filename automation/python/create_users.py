@@ -8,8 +8,24 @@ Supports CSV import and manual user creation.
 import asyncio
 import csv
 import argparse
+import logging
 from okta_client import OktaClientWrapper
 
+logger = logging.getLogger(__name__)
+
+# Aggregate progress is reported every this many rows; per-row results
+# only appear at DEBUG so stdout doesn't serialize the event loop
+PROGRESS_INTERVAL = 1000
+
+# Okta's Enterprise tier allows up to 75 concurrent requests
+DEFAULT_CONCURRENCY = 75
+
+
+async def _bounded(sem, coro):
+    """Run a coroutine while holding a slot on the semaphore"""
+    async with sem:
+        return await coro
+
 
 async def create_single_user(okta, email, first_name, last_name, mobile_phone=None):
     """Create a single user"""
@@ -23,32 +39,101 @@ async def create_single_user(okta, email, first_name, last_name, mobile_phone=No
     if mobile_phone:
         user_profile['mobilePhone'] = mobile_phone
 
-    print(f'Creating user: {email}...')
+    logger.debug('Creating user: %s...', email)
     user = await okta.create_user(user_profile, activate=True)
-    print(f'✓ Created user: {user.profile.email} (ID: {user.id})')
+    logger.debug('✓ Created user: %s (ID: %s)', user.profile.email, user.id)
     return user
 
 
-async def create_users_from_csv(okta, csv_file):
-    """Create multiple users from CSV file"""
-    created_users = []
+# Rows handed from the CSV-parsing thread to the dispatch loop per batch
+BATCH_ROWS = 500
+
 
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
+def _iter_profile_batches(csv_file, batch_rows=BATCH_ROWS):
+    """Yield batches of (email, first_name, last_name, mobile_phone) tuples
+
+    Rows are parsed positionally with csv.reader and precomputed column
+    indices to avoid building a dict per row.
+    """
+    batch = []
+
+    with open(csv_file, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        idx = {name: i for i, name in enumerate(header)}
+        email_col = idx['email']
+        first_col = idx['firstName']
+        last_col = idx['lastName']
+        mobile_col = idx.get('mobilePhone')
 
         for row in reader:
-            try:
-                user = await create_single_user(
-                    okta,
-                    email=row['email'],
-                    first_name=row['firstName'],
-                    last_name=row['lastName'],
-                    mobile_phone=row.get('mobilePhone')
-                )
-                created_users.append(user)
+            batch.append((
+                row[email_col],
+                row[first_col],
+                row[last_col],
+                row[mobile_col] if mobile_col is not None else None
+            ))
+            if len(batch) >= batch_rows:
+                yield batch
+                batch = []
+
+    if batch:
+        yield batch
+
+
+async def create_users_from_csv(okta, csv_file, concurrency=DEFAULT_CONCURRENCY):
+    """Create multiple users from CSV file, dispatching creations concurrently
+
+    CSV parsing runs on a worker thread (asyncio.to_thread) feeding a small
+    queue of row batches, so disk reads overlap with in-flight Okta calls
+    instead of stalling the event loop.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    queue = asyncio.Queue(maxsize=4)
+    batches = _iter_profile_batches(csv_file)
+    created_users = []
 
-            except Exception as e:
-                print(f'✗ Error creating user {row["email"]}: {str(e)}')
+    async def producer():
+        while True:
+            batch = await asyncio.to_thread(next, batches, None)
+            await queue.put(batch)
+            if batch is None:
+                break
+
+    async def consumer():
+        nonlocal failed_count, processed_count
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                break
+
+            tasks = [
+                _bounded(sem, create_single_user(
+                    okta,
+                    email=email,
+                    first_name=first_name,
+                    last_name=last_name,
+                    mobile_phone=mobile_phone
+                ))
+                for email, first_name, last_name, mobile_phone in batch
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            for (email, _, _, _), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.debug('✗ Error creating user %s: %s', email, result)
+                    failed_count += 1
+                else:
+                    created_users.append(result)
+
+            processed_count += len(batch)
+            if processed_count % PROGRESS_INTERVAL < len(batch):
+                logger.info('Progress: %d rows processed (%d failed)', processed_count, failed_count)
+
+    failed_count = 0
+    processed_count = 0
+    logger.info('Creating users (%d concurrent)...', concurrency)
+    await asyncio.gather(producer(), consumer())
 
     return created_users
 
@@ -60,15 +145,24 @@ async def main():
     parser.add_argument('--first-name', help='User first name')
     parser.add_argument('--last-name', help='User last name')
     parser.add_argument('--mobile', help='User mobile phone')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Max concurrent Okta requests')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Log per-row results')
 
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(message)s'
+    )
+
     okta = OktaClientWrapper()
 
     if args.csv:
         # Bulk creation from CSV
         print(f'Creating users from CSV: {args.csv}')
-        users = await create_users_from_csv(okta, args.csv)
+        users = await create_users_from_csv(okta, args.csv, concurrency=args.concurrency)
         print(f'\nCreated {len(users)} users successfully')
 
     elif args.email and args.first_name and args.last_name:
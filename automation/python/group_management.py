@@ -6,8 +6,11 @@ CRUD operations for Okta groups and group membership management.
 
 import asyncio
 import argparse
+import logging
 from okta_client import OktaClientWrapper
 
+logger = logging.getLogger(__name__)
+
 
 async def list_groups(okta, query=None):
     """List all groups"""
@@ -30,24 +33,34 @@ async def create_group(okta, name, description=''):
 
 
 async def add_users_to_group(okta, group_id, user_emails):
-    """Add multiple users to a group"""
-    added_count = 0
+    """Add multiple users to a group
 
+    Emails resolve to user IDs via batched search queries, then the
+    membership calls dispatch concurrently (the client wrapper caps
+    in-flight requests).
+    """
+    users_by_email = await okta.find_users_by_email(user_emails)
+
+    resolved = []
     for email in user_emails:
-        try:
-            # Find user by email
-            users = await okta.list_users(query=email)
-            if not users:
-                print(f'✗ User not found: {email}')
-                continue
-
-            user = users[0]
-            await okta.add_user_to_group(group_id, user.id)
-            print(f'✓ Added {email} to group')
-            added_count += 1
+        user = users_by_email.get(email.lower())
+        if user is None:
+            logger.debug('✗ User not found: %s', email)
+        else:
+            resolved.append((email, user.id))
 
-        except Exception as e:
-            print(f'✗ Error adding {email}: {str(e)}')
+    results = await asyncio.gather(
+        *(okta.add_user_to_group(group_id, user_id) for _, user_id in resolved),
+        return_exceptions=True
+    )
+
+    added_count = 0
+    for (email, _), result in zip(resolved, results):
+        if isinstance(result, Exception):
+            logger.debug('✗ Error adding %s: %s', email, result)
+        else:
+            logger.debug('✓ Added %s to group', email)
+            added_count += 1
 
     return added_count
 
@@ -71,9 +84,16 @@ async def main():
     parser.add_argument('--add-users', help='Group ID to add users to')
     parser.add_argument('--users', nargs='+', help='User emails to add to group')
     parser.add_argument('--members', help='List members of group ID')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Log per-user results')
 
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(message)s'
+    )
+
     okta = OktaClientWrapper()
 
     if args.list:
@@ -7,47 +7,205 @@ Provides simplified interface for user and group management.
 
 import os
 import asyncio
+import functools
+import time
+from collections import namedtuple
 from okta.client import Client as OktaClient
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Okta's Enterprise tier allows up to 75 concurrent requests
+DEFAULT_CONCURRENT_LIMIT = 75
+
+RATE_LIMIT_MAX_RETRIES = 5
+
+_OktaConfig = namedtuple('OktaConfig', ['org_url', 'token'])
+
 
 class OktaClientWrapper:
     """Wrapper class for Okta SDK client"""
 
-    def __init__(self):
+    def __init__(self, concurrent_limit=DEFAULT_CONCURRENT_LIMIT):
         """Initialize Okta client with credentials from environment"""
-        self.config = {
-            'orgUrl': f'https://{os.getenv("OKTA_DOMAIN")}',
-            'token': os.getenv('OKTA_API_TOKEN')
-        }
+        cfg = self._load_config()
+        self.config = {'orgUrl': cfg.org_url, 'token': cfg.token}
+        self.client = OktaClient(self.config)
+        self._sem = asyncio.Semaphore(concurrent_limit)
+
+    @classmethod
+    def _load_config(cls):
+        """Read and validate Okta credentials from the environment
+
+        The env lookup and validation run on every call so a changed or
+        missing environment is always seen; only the config construction
+        is cached, keyed on the raw values. Validates before building the
+        org URL: the old check tested after concatenation, and
+        'https://None' is a truthy string, so a missing OKTA_DOMAIN
+        slipped through.
+        """
+        domain = os.getenv('OKTA_DOMAIN')
+        token = os.getenv('OKTA_API_TOKEN')
 
-        if not self.config['orgUrl'] or not self.config['token']:
+        if not domain or not token:
             raise ValueError('OKTA_DOMAIN and OKTA_API_TOKEN must be set in environment')
 
-        self.client = OktaClient(self.config)
+        return cls._build_config(domain, token)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _build_config(domain, token):
+        """Build the config tuple, cached per credential pair"""
+        return _OktaConfig(org_url=f'https://{domain}', token=token)
+
+    @staticmethod
+    def _is_rate_limited(resp, err):
+        """Check whether an SDK error is Okta's 429 / rate-limit response"""
+        get_status = getattr(resp, 'get_status', None)
+        if get_status is not None and get_status() == 429:
+            return True
+        message = str(err).lower()
+        return 'e0000047' in message or 'too many requests' in message
+
+    @staticmethod
+    def _retry_delay(resp, attempt):
+        """Seconds to wait before retrying a rate-limited call
+
+        Honors the X-Rate-Limit-Reset header when the SDK exposes it,
+        otherwise backs off exponentially; never sleeps more than 60s.
+        """
+        get_headers = getattr(resp, 'get_headers', None)
+        if get_headers is not None:
+            try:
+                headers = get_headers()
+                reset = headers.get('X-Rate-Limit-Reset') or headers.get('x-rate-limit-reset')
+                if reset:
+                    return max(0.0, min(float(reset) - time.time(), 60.0))
+            except (TypeError, ValueError, AttributeError):
+                pass
+        return min(2 ** attempt, 60)
+
+    async def _throttled(self, op):
+        """Run an SDK call under the shared semaphore, retrying 429s
+
+        op is a zero-argument callable returning a fresh coroutine so each
+        retry issues a new request. The semaphore caps concurrency across
+        everything dispatched through this wrapper, so callers that fan out
+        with asyncio.gather stay inside Okta's concurrent-request limit.
+        """
+        async with self._sem:
+            result = await op()
+            for attempt in range(RATE_LIMIT_MAX_RETRIES - 1):
+                resp, err = result[-2], result[-1]
+                if not err or not self._is_rate_limited(resp, err):
+                    break
+                await asyncio.sleep(self._retry_delay(resp, attempt))
+                result = await op()
+            return result
 
     async def get_user(self, user_id):
         """Get user by ID"""
-        user, resp, err = await self.client.get_user(user_id)
+        user, resp, err = await self._throttled(lambda: self.client.get_user(user_id))
         if err:
             raise Exception(f'Error fetching user: {err}')
         return user
 
-    async def list_users(self, limit=200, query=None):
+    @staticmethod
+    async def _page_items(page):
+        """Materialize one SDK page, which may be a sync or async iterable"""
+        if page is None:
+            return []
+        if hasattr(page, '__aiter__'):
+            return [item async for item in page]
+        return list(page)
+
+    async def _collect_pages(self, first_page, resp, label):
+        """
+        Drain a paginated SDK response.
+
+        Okta paginates with an opaque `after` cursor, so later page URLs are
+        unknown until the previous page returns. The best available overlap is
+        to schedule the next page fetch before accumulating the current one,
+        keeping a request in flight while Python-side work proceeds.
+        """
+        results = await self._page_items(first_page)
+        if resp is None:
+            return results
+
+        next_task = asyncio.ensure_future(resp.next()) if resp.has_next() else None
+
+        while next_task is not None:
+            page, err = await next_task
+            if err:
+                raise Exception(f'Error listing {label}: {err}')
+            next_task = asyncio.ensure_future(resp.next()) if resp.has_next() else None
+            results.extend(await self._page_items(page))
+
+        return results
+
+    async def iter_users(self, limit=200, query=None):
+        """Yield users page by page without materializing the full list"""
+        users, resp, err = await self._throttled(
+            lambda: self.client.list_users({'limit': limit, 'q': query})
+        )
+        if err:
+            raise Exception(f'Error listing users: {err}')
+
+        while True:
+            for user in await self._page_items(users):
+                yield user
+
+            if resp is None or not resp.has_next():
+                break
+
+            users, err = await resp.next()
+            if err:
+                raise Exception(f'Error listing users: {err}')
+
+    async def list_users(self, limit=200, query=None, fast_paginate=True):
         """List users with optional query filter"""
-        users, resp, err = await self.client.list_users({'limit': limit, 'q': query})
+        users, resp, err = await self._throttled(
+            lambda: self.client.list_users({'limit': limit, 'q': query})
+        )
         if err:
             raise Exception(f'Error listing users: {err}')
 
+        if fast_paginate:
+            return await self._collect_pages(users, resp, 'users')
+
         all_users = []
         async for user in users:
             all_users.append(user)
 
         return all_users
 
+    # Emails per search request; Okta accepts OR-filters of this size comfortably
+    SEARCH_CHUNK = 50
+
+    async def find_users_by_email(self, emails):
+        """Resolve email addresses to users with batched search queries
+
+        Okta's search filter accepts OR-clauses, so emails are looked up in
+        chunks of SEARCH_CHUNK instead of one list_users call per address.
+        Returns a dict mapping lowercased email -> user.
+        """
+        by_email = {}
+
+        for start in range(0, len(emails), self.SEARCH_CHUNK):
+            chunk = emails[start:start + self.SEARCH_CHUNK]
+            search = ' or '.join(f'profile.email eq "{email}"' for email in chunk)
+            users, resp, err = await self._throttled(
+                lambda: self.client.list_users({'search': search, 'limit': len(chunk)})
+            )
+            if err:
+                raise Exception(f'Error searching users: {err}')
+
+            for user in await self._page_items(users):
+                by_email[user.profile.email.lower()] = user
+
+        return by_email
+
     async def create_user(self, user_profile, activate=True):
         """
         Create new user
@@ -64,7 +222,9 @@ class OktaClientWrapper:
         profile = UserProfile(user_profile)
         user_req = CreateUserRequest({'profile': profile})
 
-        user, resp, err = await self.client.create_user(user_req, {'activate': activate})
+        user, resp, err = await self._throttled(
+            lambda: self.client.create_user(user_req, {'activate': activate})
+        )
         if err:
             raise Exception(f'Error creating user: {err}')
 
@@ -78,7 +238,25 @@ class OktaClientWrapper:
         for key, value in profile_updates.items():
             setattr(user.profile, key, value)
 
-        updated_user, resp, err = await self.client.update_user(user_id, user)
+        updated_user, resp, err = await self._throttled(
+            lambda: self.client.update_user(user_id, user)
+        )
+        if err:
+            raise Exception(f'Error updating user: {err}')
+
+        return updated_user
+
+    async def update_user_partial(self, user_id, profile_updates):
+        """Update user profile without the read-modify-write fetch
+
+        Okta's user update endpoint merges a partial profile, so sending
+        only the changed fields skips the preceding GET and halves request
+        volume for bulk updates. Use update_user when the caller needs
+        read-modify-write semantics.
+        """
+        updated_user, resp, err = await self._throttled(
+            lambda: self.client.update_user(user_id, {'profile': profile_updates})
+        )
         if err:
             raise Exception(f'Error updating user: {err}')
 
@@ -86,24 +264,29 @@ class OktaClientWrapper:
 
     async def deactivate_user(self, user_id):
         """Deactivate user"""
-        resp, err = await self.client.deactivate_user(user_id)
+        resp, err = await self._throttled(lambda: self.client.deactivate_user(user_id))
         if err:
             raise Exception(f'Error deactivating user: {err}')
         return True
 
     async def delete_user(self, user_id):
         """Delete user (must be deactivated first)"""
-        resp, err = await self.client.deactivate_or_delete_user(user_id)
+        resp, err = await self._throttled(
+            lambda: self.client.deactivate_or_delete_user(user_id)
+        )
         if err:
             raise Exception(f'Error deleting user: {err}')
         return True
 
-    async def list_groups(self, query=None):
+    async def list_groups(self, query=None, fast_paginate=True):
         """List groups with optional query"""
-        groups, resp, err = await self.client.list_groups({'q': query})
+        groups, resp, err = await self._throttled(lambda: self.client.list_groups({'q': query}))
         if err:
             raise Exception(f'Error listing groups: {err}')
 
+        if fast_paginate:
+            return await self._collect_pages(groups, resp, 'groups')
+
         all_groups = []
         async for group in groups:
             all_groups.append(group)
@@ -112,7 +295,7 @@ class OktaClientWrapper:
 
     async def get_group(self, group_id):
         """Get group by ID"""
-        group, resp, err = await self.client.get_group(group_id)
+        group, resp, err = await self._throttled(lambda: self.client.get_group(group_id))
         if err:
             raise Exception(f'Error fetching group: {err}')
         return group
@@ -124,7 +307,7 @@ class OktaClientWrapper:
         profile = GroupProfile({'name': name, 'description': description})
         group = Group({'profile': profile})
 
-        created_group, resp, err = await self.client.create_group(group)
+        created_group, resp, err = await self._throttled(lambda: self.client.create_group(group))
         if err:
             raise Exception(f'Error creating group: {err}')
 
@@ -132,24 +315,31 @@ class OktaClientWrapper:
 
     async def add_user_to_group(self, group_id, user_id):
         """Add user to group"""
-        resp, err = await self.client.add_user_to_group(group_id, user_id)
+        resp, err = await self._throttled(
+            lambda: self.client.add_user_to_group(group_id, user_id)
+        )
         if err:
             raise Exception(f'Error adding user to group: {err}')
         return True
 
     async def remove_user_from_group(self, group_id, user_id):
         """Remove user from group"""
-        resp, err = await self.client.remove_user_from_group(group_id, user_id)
+        resp, err = await self._throttled(
+            lambda: self.client.remove_user_from_group(group_id, user_id)
+        )
         if err:
             raise Exception(f'Error removing user from group: {err}')
         return True
 
-    async def get_group_members(self, group_id):
+    async def get_group_members(self, group_id, fast_paginate=True):
         """Get all members of a group"""
-        users, resp, err = await self.client.list_group_users(group_id)
+        users, resp, err = await self._throttled(lambda: self.client.list_group_users(group_id))
         if err:
             raise Exception(f'Error fetching group members: {err}')
 
+        if fast_paginate:
+            return await self._collect_pages(users, resp, 'group members')
+
         members = []
         async for user in users:
             members.append(user)
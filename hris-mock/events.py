@@ -15,15 +15,35 @@ required for IT Engineer (Identity/IAM) role.
 
 import asyncio
 import random
+import time
 import httpx
-from datetime import datetime, date, timedelta
-from typing import List, Optional, Dict, Any
+from collections import defaultdict
+from datetime import datetime, date, timedelta, timezone
+from typing import AsyncIterator, List, Optional, Dict, Any
 from enum import Enum
 from dataclasses import dataclass, field
 from faker import Faker
 import json
 import logging
 
+try:
+    from faker.providers.person import Provider as _PersonProvider
+except ImportError:
+    _PersonProvider = None
+
+try:
+    import orjson
+except ImportError:  # C-accelerated JSON is optional; fall back to httpx's stdlib encoding
+    orjson = None
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # uvloop is optional; the default selector loop works everywhere
+    uvloop = None
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -88,6 +108,47 @@ class EventGeneratorConfig:
         ]
     })
 
+    def __post_init__(self):
+        # Derived lookup tables so the generators avoid re-slicing
+        # department names and linear .index() scans on every event
+        self.dept_prefix = {d: d[:3].upper() for d in self.departments}
+        self.title_index = {
+            d: {t: i for i, t in enumerate(titles)}
+            for d, titles in self.titles_by_department.items()
+        }
+
+
+class EventEnvelope:
+    """Fixed-shape record for one generated HR event
+
+    Manual __slots__ (the repo supports Python 3.9, predating
+    dataclass(slots=True)) keeps each event to five references instead of
+    a per-instance dict — the hottest allocation on a busy stream — and
+    makes field access a fixed-offset load.
+    """
+
+    __slots__ = ("event_type", "data", "metadata", "employee_id", "previous_values")
+
+    def __init__(self, event_type, data, metadata, employee_id=None, previous_values=None):
+        self.event_type = event_type
+        self.data = data
+        self.metadata = metadata
+        self.employee_id = employee_id
+        self.previous_values = previous_values
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the wire/log representation"""
+        event = {
+            "event_type": self.event_type,
+            "data": self.data,
+            "metadata": self.metadata,
+        }
+        if self.employee_id is not None:
+            event["employee_id"] = self.employee_id
+        if self.previous_values is not None:
+            event["previous_values"] = self.previous_values
+        return event
+
 
 class EventType(str, Enum):
     """Types of HR events"""
@@ -108,17 +169,81 @@ class EventType(str, Enum):
 class HREventGenerator:
     """Generates realistic HR events for testing"""
 
+    # Names drawn per pool refill; amortizes Faker's per-call overhead
+    POOL_BLOCK = 10000
+
     def __init__(self, config: EventGeneratorConfig = None):
         self.config = config or EventGeneratorConfig()
         self.employee_counter = 0
-        self.generated_employees: List[Dict] = []
+        # Struct-of-arrays employee store: one list per field, indexed by
+        # hire order, plus a department -> [index] secondary index so the
+        # mover/leaver generators never scan the whole population.
+        self.emp_number: List[str] = []
+        self.emp_email: List[str] = []
+        self.emp_dept: List[str] = []
+        self.emp_title: List[str] = []
+        self.emp_manager_id: List[Optional[str]] = []
+        self.emp_manager_email: List[Optional[str]] = []
+        self._by_dept: Dict[str, List[int]] = defaultdict(list)
+        # Precomputed cumulative weights so random.choices skips rebuilding
+        # its weight tables on every event. _gens is positionally aligned
+        # with _gen_cumw.
+        self._gens = (
+            self.generate_new_hire,           # 40%
+            self.generate_department_transfer,  # 15%
+            self.generate_promotion,          # 15%
+            self.generate_manager_change,     # 10%
+            self.generate_termination,        # 20%
+        )
+        self._gen_cumw = (0.40, 0.55, 0.70, 0.80, 1.00)
+        self._term_types = ("voluntary", "involuntary", "contract_end", "security_concern")
+        self._term_cumw = (0.60, 0.80, 0.95, 1.00)
+        # Bulk-generated name/domain pools; popped per hire, refilled lazily
+        self._first_pool: List[str] = []
+        self._last_pool: List[str] = []
+        self._email_domains: List[str] = []
+        self._ts_cache = (0.0, "")
 
     def generate_employee_number(self) -> str:
         """Generate unique employee number"""
         self.employee_counter += 1
         return f"EMP{self.employee_counter:05d}"
 
-    def generate_new_hire(self) -> Dict[str, Any]:
+    def _now_iso(self) -> str:
+        """ISO-8601 UTC timestamp, cached for 10ms
+
+        Building and formatting a fresh datetime per event is measurable at
+        high rates; events falling in the same 10ms window share one
+        string. (datetime.utcnow() is deprecated, hence the timezone-aware
+        construction.)
+        """
+        t = time.time()
+        if t - self._ts_cache[0] > 0.01:
+            stamp = datetime.fromtimestamp(t, tz=timezone.utc).replace(tzinfo=None).isoformat()
+            self._ts_cache = (t, stamp)
+        return self._ts_cache[1]
+
+    def _refill_pools(self, n: int = POOL_BLOCK) -> None:
+        """Refill the name pools in bulk
+
+        Drawing straight from Faker's raw name lists with random.choices
+        skips the per-call locale and format machinery; falls back to
+        per-call Faker if the provider doesn't expose the lists.
+        """
+        first_names = getattr(_PersonProvider, "first_names", None)
+        last_names = getattr(_PersonProvider, "last_names", None)
+
+        if first_names and last_names:
+            self._first_pool = random.choices(list(first_names), k=n)
+            self._last_pool = random.choices(list(last_names), k=n)
+        else:
+            self._first_pool = [fake.first_name() for _ in range(n)]
+            self._last_pool = [fake.last_name() for _ in range(n)]
+
+        if not self._email_domains:
+            self._email_domains = [fake.domain_name() for _ in range(100)]
+
+    def generate_new_hire(self) -> EventEnvelope:
         """
         Generate a new hire event (JOINER)
 
@@ -130,41 +255,53 @@ class HREventGenerator:
 
         start_date = date.today() + timedelta(days=random.randint(1, 30))
 
+        if not self._first_pool:
+            self._refill_pools()
+        first_name = self._first_pool.pop()
+        last_name = self._last_pool.pop()
+
         employee = {
             "employee_number": self.generate_employee_number(),
-            "email": fake.company_email(),
-            "first_name": fake.first_name(),
-            "last_name": fake.last_name(),
+            "email": f"{first_name.lower()}.{last_name.lower()}@{random.choice(self._email_domains)}",
+            "first_name": first_name,
+            "last_name": last_name,
             "department": department,
-            "department_id": department[:3].upper(),
+            "department_id": self.config.dept_prefix[department],
             "title": title,
             "start_date": start_date.isoformat(),
             "location": random.choice(self.config.locations),
-            "cost_center": f"CC-{department[:3].upper()}-{random.randint(100, 999)}",
+            "cost_center": f"CC-{self.config.dept_prefix[department]}-{random.randint(100, 999)}",
             "employment_type": random.choice(["full_time", "contractor"]),
         }
 
-        self.generated_employees.append(employee)
-        return {
-            "event_type": EventType.NEW_HIRE,
-            "data": employee,
-            "metadata": {
+        idx = len(self.emp_number)
+        self.emp_number.append(employee["employee_number"])
+        self.emp_email.append(employee["email"])
+        self.emp_dept.append(department)
+        self.emp_title.append(title)
+        self.emp_manager_id.append(None)
+        self.emp_manager_email.append(None)
+        self._by_dept[department].append(idx)
+        return EventEnvelope(
+            event_type=EventType.NEW_HIRE,
+            data=employee,
+            metadata={
                 "source": "hris_event_generator",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": self._now_iso()
             }
-        }
+        )
 
-    def generate_department_transfer(self) -> Optional[Dict[str, Any]]:
+    def generate_department_transfer(self) -> Optional[EventEnvelope]:
         """
         Generate a department transfer event (MOVER)
 
         Returns event data that will trigger department_transfer workflow
         """
-        if not self.generated_employees:
+        if not self.emp_number:
             return None
 
-        employee = random.choice(self.generated_employees)
-        old_department = employee.get("department")
+        idx = random.randrange(len(self.emp_number))
+        old_department = self.emp_dept[idx]
 
         # Pick a different department
         new_department = random.choice([
@@ -174,42 +311,42 @@ class HREventGenerator:
         new_titles = self.config.titles_by_department.get(new_department, ["Analyst"])
         new_title = random.choice(new_titles[:3])
 
-        return {
-            "event_type": EventType.DEPARTMENT_TRANSFER,
-            "employee_id": employee.get("employee_number"),
-            "data": {
+        return EventEnvelope(
+            event_type=EventType.DEPARTMENT_TRANSFER,
+            employee_id=self.emp_number[idx],
+            data={
                 "department": new_department,
-                "department_id": new_department[:3].upper(),
+                "department_id": self.config.dept_prefix[new_department],
                 "title": new_title,
-                "cost_center": f"CC-{new_department[:3].upper()}-{random.randint(100, 999)}"
+                "cost_center": f"CC-{self.config.dept_prefix[new_department]}-{random.randint(100, 999)}"
             },
-            "previous_values": {
+            previous_values={
                 "department": old_department,
-                "department_id": old_department[:3].upper() if old_department else None,
-                "title": employee.get("title")
+                "department_id": self.config.dept_prefix.get(old_department),
+                "title": self.emp_title[idx]
             },
-            "metadata": {
+            metadata={
                 "source": "hris_event_generator",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": self._now_iso(),
                 "effective_date": (date.today() + timedelta(days=random.randint(1, 14))).isoformat()
             }
-        }
+        )
 
-    def generate_promotion(self) -> Optional[Dict[str, Any]]:
+    def generate_promotion(self) -> Optional[EventEnvelope]:
         """
         Generate a promotion event (MOVER)
 
         Returns event data for title change within same department
         """
-        if not self.generated_employees:
+        if not self.emp_number:
             return None
 
-        employee = random.choice(self.generated_employees)
-        department = employee.get("department")
-        current_title = employee.get("title")
+        idx = random.randrange(len(self.emp_number))
+        department = self.emp_dept[idx]
+        current_title = self.emp_title[idx]
 
         titles = self.config.titles_by_department.get(department, ["Analyst"])
-        current_index = titles.index(current_title) if current_title in titles else 0
+        current_index = self.config.title_index.get(department, {}).get(current_title, 0)
 
         # Promote to next level if possible
         if current_index < len(titles) - 1:
@@ -217,82 +354,74 @@ class HREventGenerator:
         else:
             return None  # Already at top
 
-        return {
-            "event_type": EventType.PROMOTION,
-            "employee_id": employee.get("employee_number"),
-            "data": {
+        return EventEnvelope(
+            event_type=EventType.PROMOTION,
+            employee_id=self.emp_number[idx],
+            data={
                 "title": new_title
             },
-            "previous_values": {
+            previous_values={
                 "title": current_title
             },
-            "metadata": {
+            metadata={
                 "source": "hris_event_generator",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": self._now_iso(),
                 "effective_date": date.today().isoformat()
             }
-        }
+        )
 
-    def generate_manager_change(self) -> Optional[Dict[str, Any]]:
+    def generate_manager_change(self) -> Optional[EventEnvelope]:
         """
         Generate a manager change event (MOVER)
 
         Returns event data that updates reporting structure
         """
-        if len(self.generated_employees) < 2:
+        if len(self.emp_number) < 2:
             return None
 
-        employee = random.choice(self.generated_employees)
-        potential_managers = [
-            e for e in self.generated_employees
-            if e.get("employee_number") != employee.get("employee_number")
-            and e.get("department") == employee.get("department")
-        ]
+        idx = random.randrange(len(self.emp_number))
+        # Managers come from the same department; the index avoids a scan
+        candidates = self._by_dept[self.emp_dept[idx]]
 
-        if not potential_managers:
+        if len(candidates) < 2:
             return None
 
-        new_manager = random.choice(potential_managers)
+        manager_idx = random.choice(candidates)
+        while manager_idx == idx:
+            manager_idx = random.choice(candidates)
 
-        return {
-            "event_type": EventType.MANAGER_CHANGE,
-            "employee_id": employee.get("employee_number"),
-            "data": {
-                "manager_id": new_manager.get("employee_number"),
-                "manager_email": new_manager.get("email")
+        return EventEnvelope(
+            event_type=EventType.MANAGER_CHANGE,
+            employee_id=self.emp_number[idx],
+            data={
+                "manager_id": self.emp_number[manager_idx],
+                "manager_email": self.emp_email[manager_idx]
             },
-            "previous_values": {
-                "manager_id": employee.get("manager_id"),
-                "manager_email": employee.get("manager_email")
+            previous_values={
+                "manager_id": self.emp_manager_id[idx],
+                "manager_email": self.emp_manager_email[idx]
             },
-            "metadata": {
+            metadata={
                 "source": "hris_event_generator",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": self._now_iso()
             }
-        }
+        )
 
-    def generate_termination(self) -> Optional[Dict[str, Any]]:
+    def generate_termination(self) -> Optional[EventEnvelope]:
         """
         Generate a termination event (LEAVER)
 
         Returns event data that will trigger offboarding workflow
         """
-        if not self.generated_employees:
+        if not self.emp_number:
             return None
 
-        employee = random.choice(self.generated_employees)
-
-        termination_types = [
-            ("voluntary", 0.6),
-            ("involuntary", 0.2),
-            ("contract_end", 0.15),
-            ("security_concern", 0.05)
-        ]
+        idx = random.randrange(len(self.emp_number))
 
-        # Weighted random selection
+        # Weighted random selection (voluntary 60%, involuntary 20%,
+        # contract_end 15%, security_concern 5%)
         termination_type = random.choices(
-            [t[0] for t in termination_types],
-            weights=[t[1] for t in termination_types]
+            self._term_types, cum_weights=self._term_cumw, k=1
         )[0]
 
         # Compliance hold required for involuntary or security
@@ -302,25 +431,34 @@ class HREventGenerator:
         if termination_type == "security_concern":
             termination_date = date.today()  # Immediate
 
-        return {
-            "event_type": EventType.TERMINATION,
-            "employee_id": employee.get("employee_number"),
-            "data": {
+        return EventEnvelope(
+            event_type=EventType.TERMINATION,
+            employee_id=self.emp_number[idx],
+            data={
                 "termination_date": termination_date.isoformat(),
                 "termination_type": termination_type,
                 "compliance_hold": compliance_hold,
                 "last_day_worked": (termination_date - timedelta(days=1)).isoformat()
             },
-            "previous_values": {
+            previous_values={
                 "employment_status": "active"
             },
-            "metadata": {
+            metadata={
                 "source": "hris_event_generator",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": self._now_iso()
             }
-        }
+        )
+
+    def _sample_generators(self, n: int) -> List:
+        """Sample n weighted event generators in one C-level RNG call
 
-    def generate_random_event(self) -> Dict[str, Any]:
+        random.choices runs its whole sampling loop in C, so drawing a
+        batch of indices at once costs far less than n single-item draws
+        from Python.
+        """
+        return random.choices(self._gens, cum_weights=self._gen_cumw, k=n)
+
+    def generate_random_event(self) -> EventEnvelope:
         """
         Generate a random HR event
 
@@ -331,28 +469,7 @@ class HREventGenerator:
         - Manager changes: 10%
         - Terminations: 20%
         """
-        event_weights = [
-            (EventType.NEW_HIRE, 0.40),
-            (EventType.DEPARTMENT_TRANSFER, 0.15),
-            (EventType.PROMOTION, 0.15),
-            (EventType.MANAGER_CHANGE, 0.10),
-            (EventType.TERMINATION, 0.20),
-        ]
-
-        event_type = random.choices(
-            [e[0] for e in event_weights],
-            weights=[e[1] for e in event_weights]
-        )[0]
-
-        generators = {
-            EventType.NEW_HIRE: self.generate_new_hire,
-            EventType.DEPARTMENT_TRANSFER: self.generate_department_transfer,
-            EventType.PROMOTION: self.generate_promotion,
-            EventType.MANAGER_CHANGE: self.generate_manager_change,
-            EventType.TERMINATION: self.generate_termination,
-        }
-
-        event = generators[event_type]()
+        event = self._sample_generators(1)[0]()
 
         # If event generation failed (no employees yet), generate new hire
         if event is None:
@@ -360,46 +477,138 @@ class HREventGenerator:
 
         return event
 
+    def generate_batch(self, n: int) -> List[EventEnvelope]:
+        """Generate n random events with one sampling pass
+
+        The weighted generator draw happens once for the whole batch, so
+        per-event RNG overhead is amortized; the employee store is already
+        column-oriented, so this is the batch entry point for throughput
+        runs.
+        """
+        events = []
+        for generate in self._sample_generators(n):
+            event = generate()
+            if event is None:
+                event = self.generate_new_hire()
+            events.append(event)
+        return events
+
+    async def stream(self, rate: float) -> AsyncIterator[EventEnvelope]:
+        """Yield random events indefinitely at roughly `rate` events/second
+
+        Pacing sleeps with +/-50% jitter so the stream looks less
+        synthetic. Composing this with EventSender lets generation and
+        HTTP delivery overlap instead of strictly alternating.
+        """
+        interval = 1.0 / rate if rate > 0 else 0.0
+
+        while True:
+            yield self.generate_random_event()
+            delay = interval * random.uniform(0.5, 1.5)
+            # Sub-millisecond sleeps cost a future allocation and a loop
+            # round-trip for no useful pacing; skip them entirely
+            if delay > 0.001:
+                await asyncio.sleep(delay)
+
 
 # =============================================================================
 # EVENT SENDER
 # =============================================================================
 
 class EventSender:
-    """Sends generated events to HRIS API and webhooks"""
+    """Sends generated events to HRIS API and webhooks
+
+    Holds a single pooled httpx client for the sender's lifetime so every
+    event reuses established connections instead of paying DNS + TCP + TLS
+    setup per request. Use as an async context manager.
+    """
 
     def __init__(self, config: EventGeneratorConfig):
         self.config = config
-
-    async def send_to_hris(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        self._client = httpx.AsyncClient(
+            base_url=config.hris_base_url,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+            timeout=10.0
+        )
+        self._buf: List[EventEnvelope] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "EventSender":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Flush any buffered events and close the underlying HTTP client"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+        await self._client.aclose()
+
+    async def enqueue(self, event: EventEnvelope) -> List[Dict[str, Any]]:
+        """Buffer an event, flushing once config.batch_size is reached
+
+        Returns the flush results when this call triggered a flush, else [].
+        A background task flushes stragglers every event_interval_seconds.
+        """
+        self._buf.append(event)
+        if len(self._buf) >= self.config.batch_size:
+            return await self.flush()
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flusher())
+        return []
+
+    async def flush(self) -> List[Dict[str, Any]]:
+        """Send all buffered events concurrently over the pooled client"""
+        buf, self._buf = self._buf, []
+        if not buf:
+            return []
+        return await asyncio.gather(
+            *(self.send_to_hris(event) for event in buf),
+            return_exceptions=True
+        )
+
+    async def _flusher(self) -> None:
+        """Periodically flush so buffered events never wait indefinitely"""
+        try:
+            while True:
+                await asyncio.sleep(self.config.event_interval_seconds)
+                for result in await self.flush():
+                    if isinstance(result, Exception):
+                        logger.error(f"Failed to send buffered event: {result}")
+        except asyncio.CancelledError:
+            pass
+
+    async def send_to_hris(self, event: EventEnvelope) -> Dict[str, Any]:
         """Send event to HRIS mock server"""
-        event_type = event.get("event_type")
-
-        async with httpx.AsyncClient() as client:
-            if event_type == EventType.NEW_HIRE:
-                response = await client.post(
-                    f"{self.config.hris_base_url}/api/v1/employees",
-                    json=event["data"]
-                )
-            elif event_type == EventType.TERMINATION:
-                employee_id = event.get("employee_id")
-                response = await client.post(
-                    f"{self.config.hris_base_url}/api/v1/employees/{employee_id}/terminate",
-                    json=event["data"]
-                )
-            else:
-                # Updates (transfer, promotion, manager change)
-                employee_id = event.get("employee_id")
-                response = await client.patch(
-                    f"{self.config.hris_base_url}/api/v1/employees/{employee_id}",
-                    json=event["data"]
-                )
-
-            return {
-                "status_code": response.status_code,
-                "response": response.json() if response.status_code < 400 else None,
-                "error": response.text if response.status_code >= 400 else None
-            }
+        event_type = event.event_type
+
+        # Pre-encode with orjson when available so httpx skips its
+        # stdlib json.dumps pass
+        if orjson is not None:
+            body = {"content": orjson.dumps(event.data), "headers": _JSON_HEADERS}
+        else:
+            body = {"json": event.data}
+
+        if event_type == EventType.NEW_HIRE:
+            response = await self._client.post("/api/v1/employees", **body)
+        elif event_type == EventType.TERMINATION:
+            response = await self._client.post(
+                f"/api/v1/employees/{event.employee_id}/terminate", **body
+            )
+        else:
+            # Updates (transfer, promotion, manager change)
+            response = await self._client.patch(
+                f"/api/v1/employees/{event.employee_id}", **body
+            )
+
+        return {
+            "status_code": response.status_code,
+            "response": response.json() if response.status_code < 400 else None,
+            "error": response.text if response.status_code >= 400 else None
+        }
 
 
 # =============================================================================
@@ -409,7 +618,8 @@ class EventSender:
 async def run_event_stream(
     config: EventGeneratorConfig = None,
     num_events: int = None,
-    continuous: bool = False
+    continuous: bool = False,
+    batch: int = 1
 ):
     """
     Run continuous event generation for testing
@@ -418,33 +628,78 @@ async def run_event_stream(
         config: Event generator configuration
         num_events: Number of events to generate (None for continuous)
         continuous: Run continuously until interrupted
+        batch: Events dispatched concurrently per round; values > 1 skip
+            pacing and drive the shared client at full throughput
     """
     config = config or EventGeneratorConfig()
     generator = HREventGenerator(config)
-    sender = EventSender(config)
 
     events_generated = 0
+    rate = 1.0 / config.event_interval_seconds if config.event_interval_seconds > 0 else 0.0
+    # Deliveries in flight at once; generation keeps going while they run
+    max_in_flight = 100
+    pending = set()
+
+    def _on_sent(task):
+        pending.discard(task)
+        try:
+            result = task.result()
+            logger.info(f"HRIS response: {result['status_code']}")
+        except Exception as e:
+            logger.error(f"Failed to send event: {e}")
 
     logger.info("Starting HR event generator...")
     logger.info(f"HRIS URL: {config.hris_base_url}")
 
     try:
-        while continuous or (num_events is None) or (events_generated < num_events):
-            event = generator.generate_random_event()
-
-            logger.info(f"Generated event: {event['event_type'].value}")
-            logger.info(f"Event data: {json.dumps(event, default=str, indent=2)}")
-
-            try:
-                result = await sender.send_to_hris(event)
-                logger.info(f"HRIS response: {result['status_code']}")
-            except Exception as e:
-                logger.error(f"Failed to send event: {e}")
-
-            events_generated += 1
-
-            if not (num_events and events_generated >= num_events):
-                await asyncio.sleep(config.event_interval_seconds)
+        async with EventSender(config) as sender:
+            if batch > 1:
+                # Throughput mode: generate a whole batch, then fan the
+                # sends out together so the pooled client stays saturated
+                while continuous or num_events is None or events_generated < num_events:
+                    n = batch
+                    if not continuous and num_events is not None:
+                        n = min(batch, num_events - events_generated)
+                    events = generator.generate_batch(n)
+                    results = await asyncio.gather(
+                        *(sender.send_to_hris(event) for event in events),
+                        return_exceptions=True
+                    )
+                    for event, result in zip(events, results):
+                        if isinstance(result, Exception):
+                            logger.error(f"Failed to send event: {result}")
+                        else:
+                            logger.info(
+                                f"{event.event_type.value}: {result['status_code']}"
+                            )
+                    events_generated += n
+
+                logger.info(f"Total events generated: {events_generated}")
+                return
+
+            async for event in generator.stream(rate):
+                logger.info(f"Generated event: {event.event_type.value}")
+                if orjson is not None:
+                    dump = orjson.dumps(
+                        event.to_dict(), default=str, option=orjson.OPT_INDENT_2
+                    ).decode()
+                else:
+                    dump = json.dumps(event.to_dict(), default=str, indent=2)
+                logger.info(f"Event data: {dump}")
+
+                task = asyncio.create_task(sender.send_to_hris(event))
+                pending.add(task)
+                task.add_done_callback(_on_sent)
+
+                if len(pending) >= max_in_flight:
+                    await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                events_generated += 1
+                if not continuous and num_events is not None and events_generated >= num_events:
+                    break
+
+            if pending:
+                await asyncio.wait(pending)
 
     except KeyboardInterrupt:
         logger.info("Event generator stopped by user")
@@ -483,6 +738,12 @@ def main():
         action="store_true",
         help="Run continuously"
     )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=1,
+        help="Dispatch events in concurrent batches of this size"
+    )
 
     args = parser.parse_args()
 
@@ -494,7 +755,8 @@ def main():
     asyncio.run(run_event_stream(
         config=config,
         num_events=args.count if not args.continuous else None,
-        continuous=args.continuous
+        continuous=args.continuous,
+        batch=args.batch
     ))
 
 
@@ -8,11 +8,45 @@ Chainguard Relevance: Demonstrates understanding of enterprise HR data
 structures required for IT Engineer (Identity/IAM) role.
 """
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List, Dict, Any
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from enum import Enum
 import uuid
+import os
+import threading
+
+
+def _now() -> datetime:
+    """Timezone-aware current time; cheaper than the deprecated utcnow()"""
+    return datetime.now(timezone.utc)
+
+
+# uuid.uuid4() draws 16 bytes of entropy through a syscall per call; a
+# pooled urandom block amortizes that to one syscall per 256 ids
+_UUID_POOL_BYTES = 4096
+_uuid_pool = b""
+_uuid_pos = _UUID_POOL_BYTES
+_uuid_lock = threading.Lock()
+
+
+# SCIM schema URIs are static; shared tuples avoid rebuilding the list
+# of URN strings on every conversion
+_SCIM_CORE_SCHEMA = "urn:ietf:params:scim:schemas:core:2.0:User"
+_SCIM_ENTERPRISE_SCHEMA = "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User"
+_SCIM_SCHEMAS = (_SCIM_CORE_SCHEMA, _SCIM_ENTERPRISE_SCHEMA)
+
+
+def fast_uuid() -> str:
+    """Random UUIDv4 string sliced from a pooled os.urandom buffer"""
+    global _uuid_pool, _uuid_pos
+    with _uuid_lock:
+        if _uuid_pos >= _UUID_POOL_BYTES:
+            _uuid_pool = os.urandom(_UUID_POOL_BYTES)
+            _uuid_pos = 0
+        raw = _uuid_pool[_uuid_pos:_uuid_pos + 16]
+        _uuid_pos += 16
+    return str(uuid.UUID(bytes=raw, version=4))
 
 
 # =============================================================================
@@ -196,7 +230,7 @@ class Employee(BaseModel):
     - Compliance reporting (SOC 2, etc.)
     """
     # Identifiers
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=fast_uuid)
     employee_number: str
     external_id: Optional[str] = None  # For SCIM
 
@@ -225,16 +259,15 @@ class Employee(BaseModel):
     custom_attributes: Dict[str, Any] = Field(default_factory=dict)
 
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
     created_by: Optional[str] = None
     updated_by: Optional[str] = None
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            date: lambda v: v.isoformat()
-        }
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Any field assignment invalidates the cached conversions
+        self.__dict__["_profile_cache"] = None
 
     @property
     def email(self) -> str:
@@ -252,9 +285,28 @@ class Employee(BaseModel):
     def is_manager(self) -> bool:
         return self.position.is_manager
 
+    def _conversion_cache(self) -> Dict[str, Any]:
+        """Per-instance cache for the Okta/SCIM conversions
+
+        Populated lazily; __setattr__ drops it whenever a field changes,
+        so repeat provisioning requests for an unchanged employee are a
+        dict lookup instead of a rebuild.
+        """
+        cache = self.__dict__.get("_profile_cache")
+        if cache is None:
+            cache = {}
+            self.__dict__["_profile_cache"] = cache
+        return cache
+
     def to_okta_profile(self) -> Dict[str, Any]:
         """Convert to Okta user profile format"""
-        return {
+        cache = self._conversion_cache()
+        profile = cache.get("okta")
+        if profile is not None:
+            return profile
+
+        manager = self.manager
+        profile = cache["okta"] = {
             "firstName": self.name.first_name,
             "lastName": self.name.last_name,
             "displayName": self.display_name,
@@ -263,30 +315,52 @@ class Employee(BaseModel):
             "employeeNumber": self.employee_number,
             "department": self.department.name,
             "title": self.position.title,
-            "manager": self.manager.email if self.manager else None,
-            "managerId": self.manager.id if self.manager else None,
+            "manager": manager.email if manager else None,
+            "managerId": manager.id if manager else None,
             "costCenter": self.department.cost_center,
             "location": self.location.name,
             "startDate": self.employment.hire_date.isoformat(),
             "employeeType": self.employment.type.value,
             "workerType": self.employment.worker_type.value,
         }
+        return profile
 
     def to_scim_user(self) -> Dict[str, Any]:
         """Convert to SCIM 2.0 User format"""
-        return {
-            "schemas": [
-                "urn:ietf:params:scim:schemas:core:2.0:User",
-                "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User"
-            ],
+        cache = self._conversion_cache()
+        user = cache.get("scim")
+        if user is not None:
+            return user
+
+        name = self.name
+        manager = self.manager
+        department = self.department
+
+        enterprise = {
+            "employeeNumber": self.employee_number,
+            "costCenter": department.cost_center,
+            "organization": department.name,
+            "division": department.parent_id,
+            "department": department.name,
+            "manager": None,
+        }
+        if manager:
+            enterprise["manager"] = {
+                "value": manager.id,
+                "$ref": f"/Users/{manager.id}",
+                "displayName": manager.name
+            }
+
+        user = cache["scim"] = {
+            "schemas": _SCIM_SCHEMAS,
             "id": self.id,
             "externalId": self.employee_number,
             "userName": self.email,
             "name": {
-                "givenName": self.name.first_name,
-                "familyName": self.name.last_name,
-                "middleName": self.name.middle_name,
-                "formatted": self.name.full_name
+                "givenName": name.first_name,
+                "familyName": name.last_name,
+                "middleName": name.middle_name,
+                "formatted": name.full_name
             },
             "displayName": self.display_name,
             "emails": [
@@ -297,19 +371,9 @@ class Employee(BaseModel):
             ] if self.contact.work_phone else [],
             "active": self.is_active,
             "title": self.position.title,
-            "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {
-                "employeeNumber": self.employee_number,
-                "costCenter": self.department.cost_center,
-                "organization": self.department.name,
-                "division": self.department.parent_id,
-                "department": self.department.name,
-                "manager": {
-                    "value": self.manager.id,
-                    "$ref": f"/Users/{self.manager.id}",
-                    "displayName": self.manager.name
-                } if self.manager else None
-            }
+            _SCIM_ENTERPRISE_SCHEMA: enterprise
         }
+        return user
 
 
 # =============================================================================
@@ -325,11 +389,11 @@ class ChangeDetail(BaseModel):
 
 class EmployeeEvent(BaseModel):
     """Event representing an employee lifecycle change"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=fast_uuid)
     event_type: str
     employee_id: str
     employee_email: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_now)
     changes: List[ChangeDetail] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     source: str = "hris"  # Where the event originated
@@ -6,18 +6,65 @@ Supports users and groups endpoints with full CRUD operations.
 """
 
 import os
+import re
 import json
+import time
+import hmac
+import hashlib
 import sqlite3
-from datetime import datetime
-from flask import Flask, request, jsonify
+from datetime import datetime, timezone
+from functools import wraps
+from flask import Flask, request, Response
 from flask_cors import CORS
 from dotenv import load_dotenv
+from db_pool import init_pool, borrow
+
+try:
+    import orjson
+except ImportError:  # C-accelerated JSON is optional; fall back to stdlib encoding
+    orjson = None
 
 load_dotenv()
 
 app = Flask(__name__)
 CORS(app)
 
+
+def scim_json(payload):
+    """Serialize a SCIM payload to a JSON response body
+
+    orjson encodes in C when installed, which matters for the list
+    endpoints Okta polls constantly; jsonify's stdlib path is the
+    fallback.
+    """
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload)
+    return Response(body, mimetype='application/json')
+
+
+# Fragment splices pre-serialized bytes into an orjson document verbatim;
+# it only exists in orjson >= 3.9.1, so feature-detect it rather than
+# assuming any installed orjson has it
+_Fragment = getattr(orjson, 'Fragment', None) if orjson is not None else None
+
+# The schemas arrays are identical on every response; with Fragment they
+# are pre-serialized once and spliced in verbatim, so the encoder never
+# re-walks or re-escapes the URN strings
+if _Fragment is not None:
+    _USER_SCHEMAS = _Fragment(b'["urn:ietf:params:scim:schemas:core:2.0:User"]')
+    _GROUP_SCHEMAS = _Fragment(b'["urn:ietf:params:scim:schemas:core:2.0:Group"]')
+    _LIST_SCHEMAS = _Fragment(b'["urn:ietf:params:scim:api:messages:2.0:ListResponse"]')
+    _BULK_SCHEMAS = _Fragment(b'["urn:ietf:params:scim:api:messages:2.0:BulkResponse"]')
+    _ERROR_SCHEMAS = _Fragment(b'["urn:ietf:params:scim:api:messages:2.0:Error"]')
+else:
+    _USER_SCHEMAS = ['urn:ietf:params:scim:schemas:core:2.0:User']
+    _GROUP_SCHEMAS = ['urn:ietf:params:scim:schemas:core:2.0:Group']
+    _LIST_SCHEMAS = ['urn:ietf:params:scim:api:messages:2.0:ListResponse']
+    _BULK_SCHEMAS = ['urn:ietf:params:scim:api:messages:2.0:BulkResponse']
+    _ERROR_SCHEMAS = ['urn:ietf:params:scim:api:messages:2.0:Error']
+
 # Configuration
 SCIM_BEARER_TOKEN = os.getenv('SCIM_BEARER_TOKEN', 'change_this_token')
 DATABASE_PATH = os.getenv('DATABASE_PATH', 'scim_users.db')
@@ -44,93 +91,134 @@ def init_db():
                   created TEXT,
                   modified TEXT)''')
 
+    # username already has the implicit UNIQUE index from the table
+    # definition; these cover the other lookups Okta issues
+    c.execute('CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_users_active ON users(active) WHERE active=1')
+
     conn.commit()
     conn.close()
 
 init_db()
+init_pool(DATABASE_PATH)
+
+# Response cache for the read-heavy GET endpoints Okta polls constantly.
+# Entries live for a short TTL and are dropped on any write; if the
+# database errors mid-refresh, the last stale entry is served instead.
+_CACHE_TTL = {'short': 5.0, 'long': 30.0}
+_response_cache = {}
+
+
+def cached(policy='short'):
+    """Cache a GET handler's successful response body for a short TTL"""
+    ttl = _CACHE_TTL[policy]
+
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            key = f"{request.path}?{request.query_string.decode()}"
+            now = time.monotonic()
+            entry = _response_cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            try:
+                result = f(*args, **kwargs)
+            except sqlite3.Error:
+                # Serve the stale copy rather than failing the poll
+                if entry is not None:
+                    return entry[1]
+                raise
+
+            if isinstance(result, Response) and result.status_code == 200:
+                _response_cache[key] = (now + ttl, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_cache():
+    """Drop all cached GET responses after a write"""
+    _response_cache.clear()
+
+
+# Authentication middleware. The expected token and the 401 bodies are
+# precomputed once — this path runs on every request
+_EXPECTED_TOKEN = SCIM_BEARER_TOKEN.encode()
+_BEARER_PREFIX = 'Bearer '
+
+
+def _auth_error_body(detail):
+    payload = {
+        'schemas': _ERROR_SCHEMAS,
+        'status': '401',
+        'detail': detail
+    }
+    return orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+
+
+_UNAUTHORIZED_BODY = _auth_error_body('Unauthorized')
+_INVALID_TOKEN_BODY = _auth_error_body('Invalid token')
+
 
-# Authentication middleware
 def require_auth(f):
+    @wraps(f)
     def wrapper(*args, **kwargs):
-        auth_header = request.headers.get('Authorization')
-
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({
-                'schemas': ['urn:ietf:params:scim:api:messages:2.0:Error'],
-                'status': '401',
-                'detail': 'Unauthorized'
-            }), 401
+        auth_header = request.headers.get('Authorization', '')
 
-        token = auth_header.split(' ')[1]
+        if not auth_header.startswith(_BEARER_PREFIX):
+            return Response(_UNAUTHORIZED_BODY, status=401, mimetype='application/json')
 
-        if token != SCIM_BEARER_TOKEN:
-            return jsonify({
-                'schemas': ['urn:ietf:params:scim:api:messages:2.0:Error'],
-                'status': '401',
-                'detail': 'Invalid token'
-            }), 401
+        # compare_digest runs in constant time, so the comparison leaks
+        # nothing about how much of a guessed token matched
+        token = auth_header[len(_BEARER_PREFIX):].encode()
+        if not hmac.compare_digest(token, _EXPECTED_TOKEN):
+            return Response(_INVALID_TOKEN_BODY, status=401, mimetype='application/json')
 
         return f(*args, **kwargs)
 
-    wrapper.__name__ = f.__name__
     return wrapper
 
-# Users endpoints
-@app.route('/scim/v2/Users', methods=['GET'])
-@require_auth
-def list_users():
-    """List all users"""
-    conn = sqlite3.connect(DATABASE_PATH)
-    c = conn.cursor()
-    c.execute('SELECT * FROM users')
-    rows = c.fetchall()
-    conn.close()
+# Okta filters list queries with 'userName eq "..."'; matching it here
+# lets the database do an indexed lookup instead of returning every row
+_USERNAME_FILTER_RE = re.compile(r'\s*userName\s+eq\s+"([^"]*)"\s*$', re.IGNORECASE)
 
-    resources = []
-    for row in rows:
-        resources.append({
-            'id': row[0],
-            'userName': row[1],
-            'name': {
-                'givenName': row[2],
-                'familyName': row[3]
-            },
-            'emails': [{'value': row[4], 'primary': True}],
-            'active': bool(row[5]),
-            'meta': {
-                'resourceType': 'User',
-                'created': row[6],
-                'lastModified': row[7]
-            }
-        })
 
-    return jsonify({
-        'schemas': ['urn:ietf:params:scim:api:messages:2.0:ListResponse'],
-        'totalResults': len(resources),
-        'startIndex': 1,
-        'itemsPerPage': len(resources),
-        'Resources': resources
-    })
+# Timestamps are cached within a 10ms window: a POST burst stamps every
+# row with the same created/modified second anyway, so rebuilding the
+# datetime + ISO string per call is wasted work
+_ts_cache = (0.0, '')
 
-@app.route('/scim/v2/Users/<user_id>', methods=['GET'])
-@require_auth
-def get_user(user_id):
-    """Get user by ID"""
-    conn = sqlite3.connect(DATABASE_PATH)
-    c = conn.cursor()
-    c.execute('SELECT * FROM users WHERE id=?', (user_id,))
-    row = c.fetchone()
-    conn.close()
 
-    if not row:
-        return jsonify({
-            'schemas': ['urn:ietf:params:scim:api:messages:2.0:Error'],
-            'status': '404',
-            'detail': 'User not found'
-        }), 404
+def _utc_iso():
+    """Current UTC time as the SCIM 'YYYY-MM-DDTHH:MM:SS.ffffffZ' string"""
+    global _ts_cache
+    t = time.time()
+    cached_at, cached = _ts_cache
+    if t - cached_at < 0.01:
+        return cached
+    stamp = datetime.fromtimestamp(t, tz=timezone.utc).replace(tzinfo=None).isoformat() + 'Z'
+    _ts_cache = (t, stamp)
+    return stamp
+
+
+def _generate_id(value):
+    """Derive a stable resource id from a unique attribute like userName
+
+    Python's built-in hash() is salted per process, so the old ids
+    changed on every restart and could collide after truncating to ten
+    decimal digits. SHA-256 (OpenSSL-backed, SHA-NI accelerated where
+    available) is stable across processes and 16 hex chars keeps
+    collisions negligible.
+    """
+    return hashlib.sha256(value.encode()).hexdigest()[:16]
+
 
-    return jsonify({
-        'schemas': ['urn:ietf:params:scim:schemas:core:2.0:User'],
+def _row_to_scim(row):
+    """Render one users row as a SCIM resource dict"""
+    return {
         'id': row[0],
         'userName': row[1],
         'name': {
@@ -144,6 +232,77 @@ def get_user(user_id):
             'created': row[6],
             'lastModified': row[7]
         }
+    }
+
+
+# Users endpoints
+@app.route('/scim/v2/Users', methods=['GET'])
+@require_auth
+@cached('short')
+def list_users():
+    """List users, optionally filtered by userName, one page at a time
+
+    Pagination runs in SQL, so a count=100 request reads 100 rows no
+    matter how large the user table grows.
+    """
+    filter_param = request.args.get('filter', '')
+    match = _USERNAME_FILTER_RE.match(filter_param) if filter_param else None
+    start_index = max(request.args.get('startIndex', 1, type=int), 1)
+    count = request.args.get('count', 100, type=int)
+    offset = start_index - 1
+
+    with borrow() as conn:
+        if match:
+            username = match.group(1)
+            total = conn.execute('SELECT COUNT(*) FROM users WHERE username=?',
+                                 (username,)).fetchone()[0]
+            rows = conn.execute('SELECT * FROM users WHERE username=? LIMIT ? OFFSET ?',
+                                (username, count, offset)).fetchall()
+        else:
+            total = conn.execute('SELECT COUNT(*) FROM users').fetchone()[0]
+            rows = conn.execute('SELECT * FROM users LIMIT ? OFFSET ?',
+                                (count, offset)).fetchall()
+
+    if orjson is not None:
+        # Fuse row -> JSON bytes per resource and splice them into the
+        # envelope directly, skipping the intermediate resources list
+        # and the second pass over one big response dict
+        body = (
+            b'{"schemas":["urn:ietf:params:scim:api:messages:2.0:ListResponse"],'
+            b'"totalResults":%d,"startIndex":%d,"itemsPerPage":%d,"Resources":['
+            % (total, start_index, len(rows))
+            + b','.join(orjson.dumps(_row_to_scim(row)) for row in rows)
+            + b']}'
+        )
+        return Response(body, mimetype='application/json')
+
+    resources = [_row_to_scim(row) for row in rows]
+    return scim_json({
+        'schemas': _LIST_SCHEMAS,
+        'totalResults': total,
+        'startIndex': start_index,
+        'itemsPerPage': len(resources),
+        'Resources': resources
+    })
+
+@app.route('/scim/v2/Users/<user_id>', methods=['GET'])
+@require_auth
+@cached('long')
+def get_user(user_id):
+    """Get user by ID"""
+    with borrow() as conn:
+        row = conn.execute('SELECT * FROM users WHERE id=?', (user_id,)).fetchone()
+
+    if not row:
+        return scim_json({
+            'schemas': _ERROR_SCHEMAS,
+            'status': '404',
+            'detail': 'User not found'
+        }), 404
+
+    return scim_json({
+        'schemas': _USER_SCHEMAS,
+        **_row_to_scim(row)
     })
 
 @app.route('/scim/v2/Users', methods=['POST'])
@@ -151,35 +310,32 @@ def get_user(user_id):
 def create_user():
     """Create new user"""
     data = request.json
-    user_id = str(hash(data['userName']))[:10]
-    now = datetime.utcnow().isoformat() + 'Z'
-
-    conn = sqlite3.connect(DATABASE_PATH)
-    c = conn.cursor()
-
-    try:
-        c.execute('''INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
-                  (user_id,
-                   data['userName'],
-                   data.get('name', {}).get('givenName', ''),
-                   data.get('name', {}).get('familyName', ''),
-                   data.get('emails', [{}])[0].get('value', ''),
-                   1 if data.get('active', True) else 0,
-                   now,
-                   now))
-        conn.commit()
-    except sqlite3.IntegrityError:
-        conn.close()
-        return jsonify({
-            'schemas': ['urn:ietf:params:scim:api:messages:2.0:Error'],
-            'status': '409',
-            'detail': 'User already exists'
-        }), 409
-
-    conn.close()
-
-    return jsonify({
-        'schemas': ['urn:ietf:params:scim:schemas:core:2.0:User'],
+    user_id = _generate_id(data['userName'])
+    now = _utc_iso()
+
+    with borrow() as conn:
+        try:
+            conn.execute('''INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
+                         (user_id,
+                          data['userName'],
+                          data.get('name', {}).get('givenName', ''),
+                          data.get('name', {}).get('familyName', ''),
+                          data.get('emails', [{}])[0].get('value', ''),
+                          1 if data.get('active', True) else 0,
+                          now,
+                          now))
+            conn.commit()
+        except sqlite3.IntegrityError:
+            return scim_json({
+                'schemas': _ERROR_SCHEMAS,
+                'status': '409',
+                'detail': 'User already exists'
+            }), 409
+
+    invalidate_cache()
+
+    return scim_json({
+        'schemas': _USER_SCHEMAS,
         'id': user_id,
         'userName': data['userName'],
         'name': data.get('name', {}),
@@ -197,35 +353,34 @@ def create_user():
 def update_user(user_id):
     """Update user"""
     data = request.json
-    now = datetime.utcnow().isoformat() + 'Z'
+    now = _utc_iso()
+
+    with borrow() as conn:
+        if request.method == 'PATCH':
+            # Handle PATCH operations
+            operations = data.get('Operations', [])
+            for op in operations:
+                if op['op'] == 'replace' and op['path'] == 'active':
+                    conn.execute('UPDATE users SET active=?, modified=? WHERE id=?',
+                                 (1 if op['value'] else 0, now, user_id))
+        else:
+            # Handle PUT (full update)
+            conn.execute('''UPDATE users SET username=?, given_name=?, family_name=?,
+                            email=?, active=?, modified=? WHERE id=?''',
+                         (data['userName'],
+                          data.get('name', {}).get('givenName', ''),
+                          data.get('name', {}).get('familyName', ''),
+                          data.get('emails', [{}])[0].get('value', ''),
+                          1 if data.get('active', True) else 0,
+                          now,
+                          user_id))
 
-    conn = sqlite3.connect(DATABASE_PATH)
-    c = conn.cursor()
+        conn.commit()
 
-    if request.method == 'PATCH':
-        # Handle PATCH operations
-        operations = data.get('Operations', [])
-        for op in operations:
-            if op['op'] == 'replace' and op['path'] == 'active':
-                c.execute('UPDATE users SET active=?, modified=? WHERE id=?',
-                          (1 if op['value'] else 0, now, user_id))
-    else:
-        # Handle PUT (full update)
-        c.execute('''UPDATE users SET username=?, given_name=?, family_name=?,
-                     email=?, active=?, modified=? WHERE id=?''',
-                  (data['userName'],
-                   data.get('name', {}).get('givenName', ''),
-                   data.get('name', {}).get('familyName', ''),
-                   data.get('emails', [{}])[0].get('value', ''),
-                   1 if data.get('active', True) else 0,
-                   now,
-                   user_id))
+    invalidate_cache()
 
-    conn.commit()
-    conn.close()
-
-    return jsonify({
-        'schemas': ['urn:ietf:params:scim:schemas:core:2.0:User'],
+    return scim_json({
+        'schemas': _USER_SCHEMAS,
         'id': user_id,
         'meta': {'lastModified': now}
     })
@@ -234,28 +389,100 @@ def update_user(user_id):
 @require_auth
 def delete_user(user_id):
     """Delete user"""
-    conn = sqlite3.connect(DATABASE_PATH)
-    c = conn.cursor()
-    c.execute('DELETE FROM users WHERE id=?', (user_id,))
-    conn.commit()
-    conn.close()
+    with borrow() as conn:
+        conn.execute('DELETE FROM users WHERE id=?', (user_id,))
+        conn.commit()
+
+    invalidate_cache()
 
     return '', 204
 
+@app.route('/scim/v2/Bulk', methods=['POST'])
+@require_auth
+def bulk_operations():
+    """Bulk user provisioning
+
+    Okta's bulk imports otherwise arrive as N sequential POSTs, each
+    paying its own statement parse and commit. This endpoint collects
+    the POST /Users operations from the SCIM bulk envelope and inserts
+    them with a single executemany inside one explicit transaction, so
+    the batch commits (or rolls back) as a unit.
+    """
+    data = request.json
+    now = _utc_iso()
+
+    rows = []
+    results = []
+    for op in data.get('Operations', []):
+        if op.get('method', '').upper() != 'POST' or op.get('path') != '/Users':
+            results.append({
+                'method': op.get('method'),
+                'bulkId': op.get('bulkId'),
+                'status': '400',
+                'detail': 'Only POST /Users operations are supported'
+            })
+            continue
+
+        op_data = op.get('data', {})
+        user_id = _generate_id(op_data['userName'])
+        rows.append((user_id,
+                     op_data['userName'],
+                     op_data.get('name', {}).get('givenName', ''),
+                     op_data.get('name', {}).get('familyName', ''),
+                     op_data.get('emails', [{}])[0].get('value', ''),
+                     1 if op_data.get('active', True) else 0,
+                     now,
+                     now))
+        results.append({
+            'method': 'POST',
+            'bulkId': op.get('bulkId'),
+            'location': f'/scim/v2/Users/{user_id}',
+            'status': '201'
+        })
+
+    if rows:
+        with borrow() as conn:
+            # Pool connections run in autocommit (isolation_level=None),
+            # where executemany commits row by row; an explicit BEGIN
+            # makes the batch atomic so a duplicate rolls everything back
+            conn.execute('BEGIN')
+            try:
+                conn.executemany('INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+                conn.execute('COMMIT')
+            except sqlite3.IntegrityError:
+                conn.execute('ROLLBACK')
+                return scim_json({
+                    'schemas': _ERROR_SCHEMAS,
+                    'status': '409',
+                    'detail': 'One or more users already exist; no operations were applied'
+                }), 409
+
+        invalidate_cache()
+
+    return scim_json({
+        'schemas': _BULK_SCHEMAS,
+        'Operations': results
+    })
+
+
 # Groups endpoints
 @app.route('/scim/v2/Groups', methods=['GET'])
 @require_auth
+@cached('short')
 def list_groups():
     """List all groups"""
-    conn = sqlite3.connect(DATABASE_PATH)
-    c = conn.cursor()
-    c.execute('SELECT * FROM groups')
-    rows = c.fetchall()
-    conn.close()
+    with borrow() as conn:
+        rows = conn.execute('SELECT * FROM groups').fetchall()
 
     resources = []
     for row in rows:
-        members = json.loads(row[2]) if row[2] else []
+        if _Fragment is not None:
+            # The members column already holds JSON; Fragment splices the
+            # stored bytes into the response verbatim, skipping the
+            # parse + re-serialize round-trip per group
+            members = _Fragment(row[2]) if row[2] else []
+        else:
+            members = json.loads(row[2]) if row[2] else []
         resources.append({
             'id': row[0],
             'displayName': row[1],
@@ -267,8 +494,8 @@ def list_groups():
             }
         })
 
-    return jsonify({
-        'schemas': ['urn:ietf:params:scim:api:messages:2.0:ListResponse'],
+    return scim_json({
+        'schemas': _LIST_SCHEMAS,
         'totalResults': len(resources),
         'Resources': resources
     })
@@ -278,20 +505,20 @@ def list_groups():
 def create_group():
     """Create new group"""
     data = request.json
-    group_id = str(hash(data['displayName']))[:10]
-    now = datetime.utcnow().isoformat() + 'Z'
+    group_id = _generate_id(data['displayName'])
+    now = _utc_iso()
 
     members = json.dumps(data.get('members', []))
 
-    conn = sqlite3.connect(DATABASE_PATH)
-    c = conn.cursor()
-    c.execute('INSERT INTO groups VALUES (?, ?, ?, ?, ?)',
-              (group_id, data['displayName'], members, now, now))
-    conn.commit()
-    conn.close()
+    with borrow() as conn:
+        conn.execute('INSERT INTO groups VALUES (?, ?, ?, ?, ?)',
+                     (group_id, data['displayName'], members, now, now))
+        conn.commit()
+
+    invalidate_cache()
 
-    return jsonify({
-        'schemas': ['urn:ietf:params:scim:schemas:core:2.0:Group'],
+    return scim_json({
+        'schemas': _GROUP_SCHEMAS,
         'id': group_id,
         'displayName': data['displayName'],
         'members': data.get('members', []),
@@ -301,10 +528,14 @@ def create_group():
 # Health check
 @app.route('/health', methods=['GET'])
 def health():
-    return jsonify({'status': 'healthy', 'timestamp': datetime.utcnow().isoformat()})
+    return scim_json({'status': 'healthy', 'timestamp': _utc_iso()})
 
 if __name__ == '__main__':
     print('Starting SCIM 2.0 Server...')
     print(f'Bearer Token: {SCIM_BEARER_TOKEN}')
     print(f'Database: {DATABASE_PATH}')
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    # threaded=True lets the dev server overlap requests: a slow database
+    # call no longer serializes every concurrent Okta provisioning call.
+    # The connection pool is sized and marked check_same_thread=False for
+    # exactly this access pattern.
+    app.run(debug=True, host='0.0.0.0', port=5001, threaded=True)